@@ -25,11 +25,11 @@ echo.
 
 REM Check packages
 echo Checking packages...
-python -c "import pandas, requests, bs4, openpyxl" 2>nul
+python -c "import pandas, aiohttp, bs4, openpyxl" 2>nul
 if %errorlevel% neq 0 (
     echo.
     echo [WARN] Installing packages...
-    pip install pandas openpyxl requests beautifulsoup4 lxml
+    pip install pandas openpyxl aiohttp beautifulsoup4 lxml
     echo.
 )
 
@@ -39,7 +39,7 @@ echo ========================================
 echo.
 
 REM Run batch scraper
-python batch_scraper.py
+python batch_scraper.py %*
 
 echo.
 pause
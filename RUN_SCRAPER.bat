@@ -25,12 +25,12 @@ echo.
 
 REM Check required packages
 echo Checking required packages...
-python -c "import pandas, requests, bs4, openpyxl" 2>nul
+python -c "import pandas, aiohttp, bs4, openpyxl" 2>nul
 if %errorlevel% neq 0 (
     echo.
     echo [WARN] Missing packages detected. Installing...
     echo.
-    pip install pandas openpyxl requests beautifulsoup4 lxml
+    pip install pandas openpyxl aiohttp beautifulsoup4 lxml
     echo.
 )
 
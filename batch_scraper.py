@@ -7,9 +7,17 @@ import pandas as pd
 import json
 import os
 import sys
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import subprocess
+import time
+import io
+import csv
+import chunk_index
+import result_io
 
 # Enable Windows terminal colors
 if os.name == 'nt':  # Windows
@@ -17,6 +25,8 @@ if os.name == 'nt':  # Windows
 
 # Configuration
 CHUNK_SIZE = 50
+SPLIT_BATCH_CHUNKS = 2000  # Chunks read from the input at a time when splitting (bounds memory)
+RESULT_FORMAT = 'csv'      # 'csv' or 'parquet' (needs pyarrow) for chunk results and the final file
 DELAY = 2
 TIMEOUT = 15
 
@@ -25,9 +35,24 @@ BASE_DIR = Path.cwd()
 INPUT_DIR = BASE_DIR / "input"
 OUTPUT_DIR = BASE_DIR / "output"
 CHUNKS_DIR = OUTPUT_DIR / "chunks"
+INDEX_FILE = OUTPUT_DIR / "chunk_index.json"  # Virtual chunks: byte offsets into the input CSV
 RESULTS_DIR = OUTPUT_DIR / "results"
 FINAL_DIR = OUTPUT_DIR / "final"
+LOGS_DIR = OUTPUT_DIR / "logs"
+HTTP_CACHE_DIR = OUTPUT_DIR / "http_cache"
 PROGRESS_FILE = OUTPUT_DIR / "progress.json"
+DOMAIN_CACHE_FILE = BASE_DIR / "domain_cache.sqlite"  # Outside output/ so it outlives one input file
+
+# Columns the statistics need (Parquet reads nothing else)
+STATS_COLUMNS = ['Website_Status', 'Scraping_Result', 'Email_Primary', 'Phone_Primary']
+
+def result_path(chunk_num, suffix=''):
+    """Result file of a chunk in the configured RESULT_FORMAT"""
+    return RESULTS_DIR / f"chunk_{chunk_num:03d}_contacts{suffix}.{RESULT_FORMAT}"
+
+def result_files_in_order():
+    """Result files sorted by chunk number (chunk_1000 after chunk_999)"""
+    return sorted(RESULTS_DIR.glob(f"chunk_*_contacts.{RESULT_FORMAT}"), key=lambda f: int(f.name.split('_')[1]))
 
 def ensure_directories():
     """Create necessary directories"""
@@ -36,6 +61,7 @@ def ensure_directories():
     CHUNKS_DIR.mkdir(exist_ok=True)
     RESULTS_DIR.mkdir(exist_ok=True)
     FINAL_DIR.mkdir(exist_ok=True)
+    LOGS_DIR.mkdir(exist_ok=True)
 
 def load_progress():
     """Load progress from JSON file and validate against actual files"""
@@ -60,63 +86,130 @@ def load_progress():
                     print(f"⚠️  Fixed progress file: {len(progress['completed_chunks'])} → {len(validated_chunks)} actual chunks")
                     progress["completed_chunks"] = validated_chunks
                     
-                    # Recalculate stats from actual files
-                    progress["stats"] = calculate_stats_from_results()
+                    # Drop stats of chunks that are no longer complete
+                    if "chunk_stats" in progress:
+                        progress["chunk_stats"] = {
+                            key: chunk_stats for key, chunk_stats in progress["chunk_stats"].items()
+                            if int(key) in validated_chunks
+                        }
+                        progress["stats"] = sum_stats(progress["chunk_stats"].values())
                     save_progress(progress)
             
+            # Progress files from older versions have no per-chunk stats: scan once
+            if "chunk_stats" not in progress:
+                rebuild_stats(progress)
+                save_progress(progress)
+            
             return progress
     return {
         "total_chunks": 0,
         "chunk_size": CHUNK_SIZE,
         "completed_chunks": [],
         "last_run": None,
-        "stats": {
-            "total_processed": 0,
-            "websites_ok": 0,
-            "websites_unavailable": 0,
-            "success": 0,
-            "no_contacts": 0,
-            "emails_found": 0,
-            "phones_found": 0,
-            "timeout": 0,
-            "connection_failed": 0,
-            "does_not_exist": 0,
-            "error": 0
-        }
+        "stats": empty_stats(),
+        "chunk_stats": {}
     }
 
 def save_progress(progress):
     """Save progress to JSON file"""
     progress["last_run"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(PROGRESS_FILE, 'w') as f:
+    # Write to a temp file then swap, so an interrupted save never leaves a truncated file
+    tmp_file = PROGRESS_FILE.with_suffix('.json.tmp')
+    with open(tmp_file, 'w') as f:
         json.dump(progress, f, indent=2)
+    os.replace(tmp_file, PROGRESS_FILE)
 
 def split_csv(input_file):
-    """Split large CSV into chunks"""
+    """Split large CSV into chunks, streaming it (plain, .gz or .zst) in bounded batches"""
     print(f"\n📂 Splitting {input_file.name} into chunks...")
+    print(f"   Chunk size: {CHUNK_SIZE} rows")
     
-    df = pd.read_csv(input_file)
-    total_rows = len(df)
-    num_chunks = (total_rows + CHUNK_SIZE - 1) // CHUNK_SIZE
+    # Batches hold whole chunks, so chunk boundaries never straddle two batches.
+    # Cells are kept as text: no per-batch type guessing (and no lost leading zeros)
+    reader = pd.read_csv(
+        input_file,
+        chunksize=CHUNK_SIZE * SPLIT_BATCH_CHUNKS,
+        dtype=str,
+        keep_default_na=False,
+        compression='infer'
+    )
+    
+    started = time.time()
+    total_rows = 0
+    num_chunks = 0
+    for batch in reader:
+        for start_idx in range(0, len(batch), CHUNK_SIZE):
+            num_chunks += 1
+            chunk_filename = CHUNKS_DIR / f"chunk_{num_chunks:03d}.csv"
+            batch.iloc[start_idx:start_idx + CHUNK_SIZE].to_csv(chunk_filename, index=False)
+        
+        total_rows += len(batch)
+        elapsed = max(time.time() - started, 1e-6)
+        print(f"\r   {total_rows:,} rows → {num_chunks} chunks ({total_rows / elapsed:,.0f} rows/s)", end='', flush=True)
+    print()
     
     print(f"   Total rows: {total_rows}")
-    print(f"   Chunk size: {CHUNK_SIZE} rows")
     print(f"   Total chunks: {num_chunks}")
+    print(f"✓ Created {num_chunks} chunks in: {CHUNKS_DIR}/ ({time.time() - started:.1f}s)")
+    return num_chunks
+
+def index_csv(input_file):
+    """Index the input CSV instead of copying it into chunk files - returns the number of chunks"""
+    print(f"\n📂 Indexing {input_file.name} (chunks are read straight from it)...")
     
-    for i in range(num_chunks):
-        start_idx = i * CHUNK_SIZE
-        end_idx = min((i + 1) * CHUNK_SIZE, total_rows)
-        chunk_df = df.iloc[start_idx:end_idx]
-        
-        chunk_filename = CHUNKS_DIR / f"chunk_{i+1:03d}.csv"
-        chunk_df.to_csv(chunk_filename, index=False)
+    started = time.time()
+    index = chunk_index.build_index(input_file)
+    chunk_index.save_index(index, INDEX_FILE)
+    
+    total_rows = index['total_rows']
+    num_chunks = (total_rows + CHUNK_SIZE - 1) // CHUNK_SIZE
+    elapsed = max(time.time() - started, 1e-6)
     
-    print(f"✓ Created {num_chunks} chunks in: {CHUNKS_DIR}/")
+    print(f"   Total rows: {total_rows} ({total_rows / elapsed:,.0f} rows/s)")
+    print(f"   Chunk size: {CHUNK_SIZE} rows")
+    print(f"   Total chunks: {num_chunks}")
+    print(f"✓ Index saved: {INDEX_FILE} ({elapsed:.1f}s)")
     return num_chunks
 
-def calculate_stats_from_results():
-    """Calculate statistics from completed result files"""
-    stats = {
+def setup_chunks(input_file):
+    """Virtual chunks for plain CSV files; compressed inputs cannot be seeked and are split"""
+    if input_file.name.lower().endswith('.csv'):
+        return index_csv(input_file)
+    return split_csv(input_file)
+
+_index = None
+
+def load_chunk(chunk_num, chunk_size):
+    """Rows of one chunk as a DataFrame, from the input index or a split chunk file"""
+    global _index
+    if not INDEX_FILE.exists():
+        chunk_file = CHUNKS_DIR / f"chunk_{chunk_num:03d}.csv"
+        return pd.read_csv(chunk_file, dtype=str, keep_default_na=False)
+    
+    if _index is None:
+        _index = chunk_index.load_index(INDEX_FILE)
+    data = chunk_index.read_rows(_index, (chunk_num - 1) * chunk_size, chunk_size)
+    return pd.read_csv(io.BytesIO(data), dtype=str, keep_default_na=False)
+
+def change_chunk_size(progress, chunk_size):
+    """Re-slice the indexed input with a new chunk size (no re-split) - returns True if applied"""
+    if not INDEX_FILE.exists():
+        print(f"⚠️  Chunks were split into files: --chunk-size needs a fresh setup (empty {OUTPUT_DIR}/)")
+        return False
+    if progress["completed_chunks"]:
+        print(f"⚠️  Chunk size stays {progress['chunk_size']}: {len(progress['completed_chunks'])} chunk(s) already done")
+        return False
+    
+    total_rows = chunk_index.load_index(INDEX_FILE)['total_rows']
+    progress["chunk_size"] = chunk_size
+    progress["total_chunks"] = (total_rows + chunk_size - 1) // chunk_size
+    save_progress(progress)
+    print(f"✓ Chunk size set to {chunk_size}: {progress['total_chunks']} chunks")
+    return True
+
+def empty_stats():
+    """Return a zeroed statistics dict"""
+    return {
         "total_processed": 0,
         "websites_ok": 0,
         "websites_unavailable": 0,
@@ -127,36 +220,84 @@ def calculate_stats_from_results():
         "timeout": 0,
         "connection_failed": 0,
         "does_not_exist": 0,
-        "error": 0
+        "http_error": 0,
+        "error": 0,
+        "skipped": 0
     }
+
+def sum_stats(stats_list):
+    """Add up several statistics dicts"""
+    total = empty_stats()
+    for stats in stats_list:
+        for key in total:
+            total[key] += stats.get(key, 0)
+    return total
+
+def calculate_chunk_stats(result_file):
+    """Calculate statistics for a single result file"""
+    stats = empty_stats()
+    df = result_io.read_results(result_file, columns=STATS_COLUMNS)
+    stats["total_processed"] = len(df)
+    
+    # Website status
+    stats["websites_ok"] = len(df[df['Website_Status'] == 'OK'])
+    stats["websites_unavailable"] = len(df[df['Website_Status'] == 'Unavailable'])
+    
+    # Scraping results
+    stats["success"] = len(df[df['Scraping_Result'] == 'Success'])
+    stats["no_contacts"] = len(df[df['Scraping_Result'] == 'No Contacts Found'])
+    stats["timeout"] = len(df[df['Scraping_Result'] == 'Timeout'])
+    stats["connection_failed"] = len(df[df['Scraping_Result'] == 'Connection Failed'])
+    stats["does_not_exist"] = len(df[df['Scraping_Result'] == 'Does Not Exist'])
+    stats["http_error"] = len(df[df['Scraping_Result'] == 'HTTP Error'])
+    stats["error"] = len(df[df['Scraping_Result'] == 'Error'])
+    stats["skipped"] = len(df[df['Scraping_Result'] == 'Skipped'])
+    
+    # Contacts found
+    stats["emails_found"] = len(df[df['Email_Primary'].notna() & (df['Email_Primary'] != '')])
+    stats["phones_found"] = len(df[df['Phone_Primary'].notna() & (df['Phone_Primary'] != '')])
     
-    result_files = sorted(RESULTS_DIR.glob("chunk_*_contacts.csv"))
+    return stats
+
+def update_chunk_stats(progress, chunk_num):
+    """Recompute one chunk's stats and adjust the running totals incrementally"""
+    result_file = result_path(chunk_num)
+    chunk_stats = progress.setdefault("chunk_stats", {})
+    
+    try:
+        new_stats = calculate_chunk_stats(result_file)
+    except Exception as e:
+        print(f"Warning: Could not read {result_file.name}: {e}")
+        new_stats = empty_stats()
+    
+    # Replace this chunk's previous contribution (if it was processed before)
+    old_stats = chunk_stats.get(str(chunk_num), empty_stats())
+    progress["stats"] = {
+        key: progress["stats"].get(key, 0) - old_stats.get(key, 0) + new_stats[key]
+        for key in new_stats
+    }
+    chunk_stats[str(chunk_num)] = new_stats
+
+def calculate_stats_from_results():
+    """Calculate per-chunk statistics by rescanning every result file"""
+    chunk_stats = {}
+    
+    result_files = result_files_in_order()
     
     for result_file in result_files:
+        chunk_num = int(result_file.name.split('_')[1])
         try:
-            df = pd.read_csv(result_file)
-            stats["total_processed"] += len(df)
-            
-            # Website status
-            stats["websites_ok"] += len(df[df['Website_Status'] == 'OK'])
-            stats["websites_unavailable"] += len(df[df['Website_Status'] == 'Unavailable'])
-            
-            # Scraping results
-            stats["success"] += len(df[df['Scraping_Result'] == 'Success'])
-            stats["no_contacts"] += len(df[df['Scraping_Result'] == 'No Contacts Found'])
-            stats["timeout"] += len(df[df['Scraping_Result'] == 'Timeout'])
-            stats["connection_failed"] += len(df[df['Scraping_Result'] == 'Connection Failed'])
-            stats["does_not_exist"] += len(df[df['Scraping_Result'] == 'Does Not Exist'])
-            stats["error"] += len(df[df['Scraping_Result'] == 'Error'])
-            
-            # Contacts found
-            stats["emails_found"] += len(df[df['Email_Primary'].notna() & (df['Email_Primary'] != '')])
-            stats["phones_found"] += len(df[df['Phone_Primary'].notna() & (df['Phone_Primary'] != '')])
+            chunk_stats[str(chunk_num)] = calculate_chunk_stats(result_file)
         except Exception as e:
             print(f"Warning: Could not read {result_file.name}: {e}")
             continue
     
-    return stats
+    return chunk_stats
+
+def rebuild_stats(progress):
+    """Full rescan of all result files (explicit action, cost grows with chunk count)"""
+    progress["chunk_stats"] = calculate_stats_from_results()
+    progress["stats"] = sum_stats(progress["chunk_stats"].values())
 
 def display_status(progress):
     """Display current status and statistics"""
@@ -190,7 +331,8 @@ def display_status(progress):
             
             print(f"\nNo contacts found: {stats['no_contacts']}/{total} ({stats['no_contacts']/total*100:.1f}%)")
             
-            failed_total = stats['timeout'] + stats['connection_failed'] + stats['does_not_exist'] + stats['error']
+            failed_total = (stats['timeout'] + stats['connection_failed'] + stats['does_not_exist']
+                            + stats.get('http_error', 0) + stats['error'])
             if failed_total > 0:
                 print(f"\nFailed to scrape: {failed_total}/{total} ({failed_total/total*100:.1f}%)")
                 if stats['timeout'] > 0:
@@ -199,8 +341,13 @@ def display_status(progress):
                     print(f"  → Connection Failed: {stats['connection_failed']}")
                 if stats['does_not_exist'] > 0:
                     print(f"  → Does Not Exist: {stats['does_not_exist']}")
+                if stats.get('http_error', 0) > 0:
+                    print(f"  → HTTP Error: {stats['http_error']}")
                 if stats['error'] > 0:
                     print(f"  → Error: {stats['error']}")
+            
+            if stats.get('skipped', 0) > 0:
+                print(f"\nSkipped (domain failing repeatedly, in cool-down): {stats['skipped']}")
         else:
             print(f"\n⚠️  {completed} chunk(s) marked as complete but contain no data")
             print(f"   These will be re-processed on next run")
@@ -212,20 +359,61 @@ def display_status(progress):
 
 def is_chunk_completed(chunk_num):
     """Check if chunk is actually completed with data"""
-    result_file = RESULTS_DIR / f"chunk_{chunk_num:03d}_contacts.csv"
+    result_file = result_path(chunk_num)
     
     if not result_file.exists():
         return False
     
-    # Check if file has actual data (more than just header row)
+    # Check if file has actual data (more than just header row) without parsing it all
     try:
-        df = pd.read_csv(result_file)
-        return len(df) > 0  # Has at least 1 row of data
+        return result_io.has_rows(result_file)
     except:
         return False
 
-def process_chunks(num_chunks_to_process, progress):
-    """Process specified number of chunks"""
+def configure_scraper(scraper, offline=False):
+    """Point the scraper at the shared caches (needed in every process that scrapes)"""
+    scraper.HTTP_CACHE_DIR = str(HTTP_CACHE_DIR)
+    scraper.HTTP_CACHE_KEEP = True  # Batch pages are the re-extraction archive
+    scraper.DOMAIN_CACHE_FILE = str(DOMAIN_CACHE_FILE)
+    scraper.OFFLINE = offline
+
+def run_chunk(chunk_num, total_chunks, log_to_file=False, chunk_size=None):
+    """Scrape one chunk into its result file (also runs inside worker processes)"""
+    import contact_scraper as scraper
+    configure_scraper(scraper)
+    
+    chunk_size = chunk_size or CHUNK_SIZE
+    output_file = result_path(chunk_num)
+    
+    if log_to_file:
+        # Workers write their per-site output to a log file instead of the shared console
+        log_file = LOGS_DIR / f"chunk_{chunk_num:03d}.log"
+        with open(log_file, 'w', encoding='utf-8') as f, contextlib.redirect_stdout(f):
+            return run_chunk(chunk_num, total_chunks, chunk_size=chunk_size)
+    
+    scraper.process_spreadsheet(
+        f"chunk_{chunk_num:03d}.csv", 
+        "WEBSITE", 
+        str(output_file),
+        chunk_info=(chunk_num, total_chunks),  # Pass chunk context
+        input_df=load_chunk(chunk_num, chunk_size)
+    )
+    
+    return chunk_num
+
+def mark_chunk_completed(progress, chunk_num):
+    """Record a finished chunk and save progress (parent process only)"""
+    # Mark as completed (avoid duplicates by converting to set and back)
+    completed_set = set(progress["completed_chunks"])
+    completed_set.add(chunk_num)
+    progress["completed_chunks"] = sorted(list(completed_set))
+    
+    # Update stats from this chunk only
+    update_chunk_stats(progress, chunk_num)
+    save_progress(progress)
+
+def process_chunks(num_chunks_to_process, progress, workers=1):
+    """Process specified number of chunks, optionally across a pool of worker processes"""
     total_chunks = progress["total_chunks"]
     completed_chunks = set(progress["completed_chunks"])
     
@@ -241,41 +429,50 @@ def process_chunks(num_chunks_to_process, progress):
         print("\n✓ All chunks already processed!")
         return
     
+    workers = max(1, min(workers, len(chunks_to_process)))
+    
     print(f"\n🌐 Processing {len(chunks_to_process)} chunks...")
-    print(f"⏱ Estimated time: ~{len(chunks_to_process) * 2} minutes")
+    if workers > 1:
+        print(f"⚙ Workers: {workers} processes (per-chunk logs in {LOGS_DIR}/)")
+    print(f"⏱ Estimated time: ~{len(chunks_to_process) * 2 / workers:.0f} minutes")
     print()
     
-    for idx, chunk_num in enumerate(chunks_to_process, 1):
-        chunk_file = CHUNKS_DIR / f"chunk_{chunk_num:03d}.csv"
-        output_file = RESULTS_DIR / f"chunk_{chunk_num:03d}_contacts.csv"
-        
-        print(f"[Chunk {idx}/{len(chunks_to_process)}] Processing chunk {chunk_num}/{total_chunks}...")
-        
-        # Call contact_scraper.py with this chunk
-        try:
-            # Run contact_scraper programmatically with chunk info
-            import contact_scraper as scraper
-            scraper.process_spreadsheet(
-                str(chunk_file), 
-                "WEBSITE", 
-                str(output_file),
-                chunk_info=(chunk_num, total_chunks)  # Pass chunk context
-            )
+    if workers == 1:
+        for idx, chunk_num in enumerate(chunks_to_process, 1):
+            output_file = result_path(chunk_num)
             
-            # Mark as completed (avoid duplicates by converting to set and back)
-            completed_set = set(progress["completed_chunks"])
-            completed_set.add(chunk_num)
-            progress["completed_chunks"] = sorted(list(completed_set))
+            print(f"[Chunk {idx}/{len(chunks_to_process)}] Processing chunk {chunk_num}/{total_chunks}...")
             
-            # Update stats
-            progress["stats"] = calculate_stats_from_results()
-            save_progress(progress)
-            
-            print(f"✓ Saved: {output_file.name}\n")
+            try:
+                run_chunk(chunk_num, total_chunks)
+                mark_chunk_completed(progress, chunk_num)
+                print(f"✓ Saved: {output_file.name}\n")
+                
+            except Exception as e:
+                print(f"✗ Error processing chunk {chunk_num}: {e}\n")
+                continue
+    else:
+        # Workers only scrape; progress.json is written by this process alone
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(run_chunk, chunk_num, total_chunks, True, CHUNK_SIZE): chunk_num
+                for chunk_num in chunks_to_process
+            }
             
-        except Exception as e:
-            print(f"✗ Error processing chunk {chunk_num}: {e}\n")
-            continue
+            for done, future in enumerate(as_completed(futures), 1):
+                chunk_num = futures[future]
+                try:
+                    future.result()
+                    mark_chunk_completed(progress, chunk_num)
+                except Exception as e:
+                    print(f"[{done}/{len(chunks_to_process)}] ✗ Error processing chunk {chunk_num}: {e}")
+                    continue
+                
+                stats = progress["stats"]
+                print(f"[{done}/{len(chunks_to_process)}] ✓ Chunk {chunk_num:03d} done | "
+                      f"Overall: {len(progress['completed_chunks'])}/{total_chunks} chunks, "
+                      f"{stats['total_processed']} hotels, {stats['success']} with contacts")
+        print()
     
     print("="*70)
     print(f"{len(chunks_to_process)} CHUNKS COMPLETED!")
@@ -308,34 +505,131 @@ def process_chunks(num_chunks_to_process, progress):
         print(f"\nRemaining: {remaining} chunks")
         print(f"Estimated time to finish: ~{est_time_hours:.1f} hours")
     
+    # Drop stale pages not kept for re-extraction (e.g. from standalone runs)
+    import contact_scraper as scraper
+    configure_scraper(scraper)
+    freed = scraper.get_cache().prune()
+    if freed:
+        print(f"\n🧹 Page cache pruned: {freed / 1024**2:.0f} MB freed")
+    
     print("\n" + "="*70)
 
-def retry_connection_failures():
+def reextract_chunk(chunk_num, total_chunks, chunk_size):
+    """Rebuild one chunk's result file from cached pages (also runs inside worker processes)
+    
+    Rows whose pages were never cached keep their previous results.
+    Returns the number of rows that could not be re-scored.
+    """
+    import contact_scraper as scraper
+    configure_scraper(scraper, offline=True)
+    
+    result_file = result_path(chunk_num)
+    new_file = result_path(chunk_num, '.reextract')
+    log_file = LOGS_DIR / f"chunk_{chunk_num:03d}_reextract.log"
+    
+    with open(log_file, 'w', encoding='utf-8') as f, contextlib.redirect_stdout(f):
+        scraper.process_spreadsheet(
+            f"chunk_{chunk_num:03d}.csv",
+            "WEBSITE",
+            str(new_file),
+            chunk_info=(chunk_num, total_chunks),
+            input_df=load_chunk(chunk_num, chunk_size)
+        )
+    
+    new_df = result_io.read_results(new_file)
+    not_cached = new_df['Scraping_Result'] == 'Not Cached'
+    if not_cached.any() and result_file.exists():
+        old_df = result_io.read_results(result_file)
+        if len(old_df) == len(new_df):
+            for col in new_df.columns:
+                if col in old_df.columns:
+                    new_df[col] = new_df[col].astype(object)
+                    new_df.loc[not_cached, col] = old_df.loc[not_cached, col]
+    
+    result_io.write_results(new_df, new_file)
+    os.replace(new_file, result_file)
+    return int(not_cached.sum())
+
+def reextract_all(progress, workers=None):
+    """Re-run extraction over every completed chunk from the page cache, on all cores"""
+    chunks = [c for c in progress["completed_chunks"] if is_chunk_completed(c)]
+    if not chunks:
+        print("\n✗ No completed chunks to re-extract!")
+        return
+    
+    workers = max(1, min(workers or os.cpu_count() or 1, len(chunks)))
+    total_chunks = progress["total_chunks"]
+    
+    print(f"\n🔁 Re-extracting {len(chunks)} chunks from {HTTP_CACHE_DIR}/ (no network)")
+    print(f"⚙ Workers: {workers} processes (per-chunk logs in {LOGS_DIR}/)\n")
+    
+    kept_total = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(reextract_chunk, chunk_num, total_chunks, CHUNK_SIZE): chunk_num for chunk_num in chunks}
+        
+        for done, future in enumerate(as_completed(futures), 1):
+            chunk_num = futures[future]
+            try:
+                kept = future.result()
+            except Exception as e:
+                print(f"[{done}/{len(chunks)}] ✗ Error re-extracting chunk {chunk_num}: {e}")
+                continue
+            
+            kept_total += kept
+            update_chunk_stats(progress, chunk_num)
+            if kept:
+                print(f"[{done}/{len(chunks)}] ⚠ Chunk {chunk_num:03d} re-extracted: "
+                      f"{kept} row(s) NOT re-scored (page not cached, previous results kept)")
+            else:
+                print(f"[{done}/{len(chunks)}] ✓ Chunk {chunk_num:03d} re-extracted")
+    
+    save_progress(progress)
+    
+    stats = progress["stats"]
+    print(f"\n✓ Re-extraction done: {stats['success']}/{stats['total_processed']} with contacts, "
+          f"{stats['emails_found']} emails, {stats['phones_found']} phones")
+    if kept_total:
+        print(f"   ⚠ {kept_total} rows had no cached page and were NOT re-scored - rerun their chunks to refresh them")
+
+def retry_connection_failures(progress):
     """Retry websites that failed due to connection issues"""
     print("\n🔍 Scanning for connection failures...")
     
-    result_files = sorted(RESULTS_DIR.glob("chunk_*_contacts.csv"))
+    result_files = result_files_in_order()
     
     if not result_files:
         print("✗ No result files found!")
         return False
     
-    # Find all connection failures
+    import contact_scraper as scraper
+    configure_scraper(scraper)
+    domain_cache = scraper.get_domain_cache()
+    
+    # Find all connection failures (only sites whose circuit is closed: the others would be skipped again)
     retry_list = []
+    cooling_down = 0
     for result_file in result_files:
         try:
-            df = pd.read_csv(result_file)
+            df = result_io.read_results(result_file, columns=['WEBSITE', 'Scraping_Result'])
             for idx, row in df.iterrows():
-                if row['Scraping_Result'] == 'Connection Failed':
-                    retry_list.append({
-                        'file': result_file,
-                        'row_index': idx,
-                        'url': row['WEBSITE']
-                    })
+                if row['Scraping_Result'] not in ('Connection Failed', 'HTTP Error', 'Skipped'):
+                    continue
+                if domain_cache.open_circuit(scraper.site_key(row['WEBSITE'])):
+                    cooling_down += 1
+                    continue
+                retry_list.append({
+                    'file': result_file,
+                    'chunk_num': int(result_file.name.split('_')[1]),
+                    'row_index': idx,
+                    'url': row['WEBSITE']
+                })
         except Exception as e:
             print(f"Warning: Could not read {result_file.name}: {e}")
             continue
     
+    if cooling_down:
+        print(f"⏭ {cooling_down} failed site(s) still in their cool-down, left for a later retry")
+    
     if not retry_list:
         print("✓ No connection failures found - all good!")
         return False
@@ -354,26 +648,30 @@ def retry_connection_failures():
     
     recovered = 0
     still_failed = 0
+    recovered_chunks = set()
     
-    # Import scraper
-    import contact_scraper as scraper
+    # Retry all websites concurrently (politeness is enforced per host)
+    results = scraper.scrape_websites(
+        [item['url'] for item in retry_list],
+        [f"[{i}/{len(retry_list)}] " for i in range(1, len(retry_list) + 1)]
+    )
     
-    for i, item in enumerate(retry_list, 1):
-        progress_msg = f"[{i}/{len(retry_list)}] "
-        
+    for item, result in zip(retry_list, results):
         try:
-            # Retry the website
-            emails, phones, website_status, scraping_result = scraper.scrape_website(
-                item['url'], 
-                progress_msg
-            )
+            emails, phones, website_status, scraping_result = result
+            
+            # Later runs should see this result, not the stored failure
+            domain = scraper.site_key(item['url'])
+            if domain:
+                country = scraper.detect_country(item['url'], scraper.finalize_phones(phones))
+                scraper.get_domain_cache().put(domain, emails, phones, website_status, scraping_result, country)
             
             # Deduplicate phones
             phones = scraper.deduplicate_phones(phones)
             
             # If successful, update the original chunk file
             if scraping_result == 'Success' or (emails or phones):
-                df = pd.read_csv(item['file'])
+                df = result_io.read_results(item['file'])
                 
                 # Update the exact row
                 df.at[item['row_index'], 'Email_Primary'] = emails[0] if emails else ''
@@ -404,22 +702,25 @@ def retry_connection_failures():
                 df.at[item['row_index'], 'Scraping_Result'] = scraping_result
                 
                 # Save updated chunk
-                df.to_csv(item['file'], index=False)
+                result_io.write_results(df, item['file'])
+                recovered_chunks.add(item['chunk_num'])
                 recovered += 1
-                print(f"  ✓ Recovered!")
+                print(f"  ✓ Recovered: {item['url']}")
             else:
                 still_failed += 1
-                print(f"  ✗ Still failed: {scraping_result}")
-            
-            # Delay between requests
-            if i < len(retry_list):
-                time.sleep(2)
+                print(f"  ✗ Still failed: {item['url']} ({scraping_result})")
         
         except Exception as e:
             print(f"  ✗ Error: {e}")
             still_failed += 1
             continue
     
+    # Refresh stats of the chunks whose rows changed
+    for chunk_num in recovered_chunks:
+        update_chunk_stats(progress, chunk_num)
+    if recovered_chunks:
+        save_progress(progress)
+    
     print("\n" + "="*70)
     print(f"RETRY COMPLETE!")
     print("="*70)
@@ -429,49 +730,144 @@ def retry_connection_failures():
     
     return recovered > 0
 
+def stream_merge(result_files, final_file, keep_row=None, dedupe_key=None):
+    """Copy result rows into one CSV, one row at a time - returns (rows written, rows dropped)
+    
+    Memory stays flat whatever the number of chunks: only the current row
+    (and the set of dedupe keys already seen, if deduplicating) is held.
+    """
+    # Header once: the columns of every file, in order of first appearance
+    fieldnames = []
+    for result_file in result_files:
+        with open(result_file, 'r', encoding='utf-8-sig', newline='') as f:
+            for name in next(csv.reader(f), []):
+                if name not in fieldnames:
+                    fieldnames.append(name)
+    
+    written = 0
+    dropped = 0
+    seen = set()
+    with open(final_file, 'w', encoding='utf-8', newline='') as out:
+        writer = csv.DictWriter(out, fieldnames=fieldnames, restval='')
+        writer.writeheader()
+        
+        for result_file in result_files:
+            with open(result_file, 'r', encoding='utf-8-sig', newline='') as f:
+                for row in csv.DictReader(f):
+                    if keep_row is not None and not keep_row(row):
+                        dropped += 1
+                        continue
+                    if dedupe_key is not None:
+                        key = dedupe_key(row)
+                        if key is not None and key in seen:
+                            dropped += 1
+                            continue
+                        seen.add(key)
+                    writer.writerow(row)
+                    written += 1
+    
+    return written, dropped
+
+def parquet_merge(result_files, final_file, keep_row=None, dedupe_key=None):
+    """Append Parquet result files into one, a chunk at a time - returns (rows written, rows dropped)"""
+    appender = result_io.ParquetAppender(final_file)
+    dropped = 0
+    seen = set()
+    try:
+        for result_file in result_files:
+            df = result_io.read_results(result_file)
+            keep = []
+            for _, row in df.iterrows():
+                key = dedupe_key(row) if dedupe_key is not None else None
+                if (keep_row is not None and not keep_row(row)) or (key is not None and key in seen):
+                    keep.append(False)
+                    continue
+                if key is not None:
+                    seen.add(key)
+                keep.append(True)
+            
+            dropped += keep.count(False)
+            # Boolean row mask aligned to the index (a bare [] would select no columns)
+            appender.append(df.loc[pd.Series(keep, index=df.index, dtype=bool)])
+    finally:
+        appender.close()
+    
+    return appender.rows, dropped
+
+def has_contacts(row):
+    """Merge filter: keep rows with at least an email or a phone"""
+    return any(isinstance(row.get(col), str) and row.get(col) != '' for col in ('Email_Primary', 'Phone_Primary'))
+
+def website_key(row):
+    """Merge dedupe key: canonical website URL (None for rows without one, never deduplicated)"""
+    import contact_scraper as scraper
+    website = row.get('WEBSITE')
+    if not isinstance(website, str) or not website.strip():
+        return None
+    return scraper.canonical_url(website)
+
 def merge_results(progress):
     """Merge all result chunks into final file"""
     
     # First, offer to retry connection failures
-    retry_connection_failures()
+    retry_connection_failures(progress)
     
     print("\n📁 Merging all results into final file...")
     
-    result_files = sorted(RESULTS_DIR.glob("chunk_*_contacts.csv"))
+    result_files = result_files_in_order()
     
     if not result_files:
         print("✗ No result files found to merge!")
         return
     
-    all_data = []
-    for result_file in result_files:
-        df = pd.read_csv(result_file)
-        all_data.append(df)
-    
-    final_df = pd.concat(all_data, ignore_index=True)
+    # Optional on-the-fly filtering and deduplication
+    keep_row = None
+    dedupe_key = None
+    if input("Only keep rows with an email or phone? (y/n): ").strip().lower() == 'y':
+        keep_row = has_contacts
+    if input("Drop duplicate websites (same site listed twice)? (y/n): ").strip().lower() == 'y':
+        dedupe_key = website_key
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    final_file = FINAL_DIR / f"contacts_FINAL_{timestamp}.csv"
-    final_df.to_csv(final_file, index=False)
+    final_file = FINAL_DIR / f"contacts_FINAL_{timestamp}.{RESULT_FORMAT}"
+    merge = parquet_merge if RESULT_FORMAT == 'parquet' else stream_merge
+    written, dropped = merge(result_files, final_file, keep_row, dedupe_key)
     
     print(f"✓ Merged {len(result_files)} files")
-    print(f"✓ Total rows: {len(final_df)}")
+    print(f"✓ Total rows: {written}" + (f" ({dropped} filtered out)" if dropped else ""))
     print(f"✓ Saved to: {final_file}")
 
-def main_menu():
+def main_menu(workers=1, chunk_size=None):
     """Main menu loop"""
+    global CHUNK_SIZE
     ensure_directories()
     
+    if RESULT_FORMAT == 'parquet':
+        try:
+            result_io.require_parquet()
+        except ValueError as e:
+            print(f"\n✗ {e}")
+            return
+    
     # Check if we need to split the input file first
     progress = load_progress()
     
+    # Chunk size is a runtime choice: indexed inputs are simply re-sliced
+    if chunk_size:
+        if progress["total_chunks"] == 0:
+            CHUNK_SIZE = chunk_size
+        elif chunk_size != progress.get("chunk_size", CHUNK_SIZE):
+            change_chunk_size(progress, chunk_size)
+    if progress["total_chunks"]:
+        CHUNK_SIZE = progress.get("chunk_size", CHUNK_SIZE)
+    
     if progress["total_chunks"] == 0:
         print("\n" + "="*70)
         print("INITIAL SETUP")
         print("="*70)
         
-        # Look for CSV file in input folder
-        csv_files = list(INPUT_DIR.glob("*.csv"))
+        # Look for CSV file in input folder (compressed exports too)
+        csv_files = sorted(f for pattern in ("*.csv", "*.csv.gz", "*.csv.zst") for f in INPUT_DIR.glob(pattern))
         
         if not csv_files:
             print(f"\n✗ No CSV file found in {INPUT_DIR}/")
@@ -488,30 +884,31 @@ def main_menu():
             input_file = csv_files[0]
             print(f"\n📂 Found: {input_file.name}")
         
-        num_chunks = split_csv(input_file)
+        num_chunks = setup_chunks(input_file)
         progress["total_chunks"] = num_chunks
+        progress["chunk_size"] = CHUNK_SIZE
         save_progress(progress)
         print("\n✓ Setup complete! Ready to process.\n")
     
     # Main loop
     while True:
         progress = load_progress()
-        progress["stats"] = calculate_stats_from_results()  # Recalculate from files
-        save_progress(progress)
         
         display_status(progress)
         
         print("\nWhat would you like to do?")
         print("1. Process NEXT [X] chunks")
         print("2. Merge results into final file")
-        print("3. Exit")
+        print("3. Rebuild statistics from result files")
+        print("4. Re-extract all chunks from cached pages (no network)")
+        print("5. Exit")
         
         try:
             choice = input("\nYour choice: ").strip()
             
             if choice == "1":
                 num = int(input("How many chunks to process? "))
-                process_chunks(num, progress)
+                process_chunks(num, progress, workers)
                 input("\nPress Enter to continue...")
                 
             elif choice == "2":
@@ -519,11 +916,21 @@ def main_menu():
                 input("\nPress Enter to continue...")
                 
             elif choice == "3":
+                print("\n🔄 Rescanning all result files...")
+                rebuild_stats(progress)
+                save_progress(progress)
+                print(f"✓ Statistics rebuilt from {len(progress['chunk_stats'])} result files")
+                
+            elif choice == "4":
+                reextract_all(progress, workers if workers > 1 else None)
+                input("\nPress Enter to continue...")
+                
+            elif choice == "5":
                 print("\n👋 Goodbye!")
                 break
                 
             else:
-                print("Invalid choice. Please enter 1, 2, or 3.")
+                print("Invalid choice. Please enter 1, 2, 3, 4, or 5.")
                 
         except KeyboardInterrupt:
             print("\n\n✓ Progress saved. Goodbye!")
@@ -533,7 +940,14 @@ def main_menu():
             input("Press Enter to continue...")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch contact scraper")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of chunks processed in parallel (one process each)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help=f"Rows per chunk (default {CHUNK_SIZE}); can be changed later for indexed inputs")
+    args = parser.parse_args()
+    
     print("\n" + "="*70)
     print("BATCH CONTACT SCRAPER - Industrial Version")
     print("="*70)
-    main_menu()
+    main_menu(workers=args.workers, chunk_size=args.chunk_size)
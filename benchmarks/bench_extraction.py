@@ -0,0 +1,127 @@
+"""
+Extraction benchmark
+Compares the legacy three-pass extraction (emails, phones, contact links each
+walking every <a>) with the single-pass extract_page_contacts on large pages.
+
+Usage:
+    python benchmarks/bench_extraction.py [page.html ...]
+
+Without arguments a synthetic heavy hotel homepage is used.
+"""
+
+import re
+import sys
+import timeit
+from html import unescape
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+import contact_scraper as scraper
+
+BASE_URL = "https://www.hotel-exemple.fr/"
+REPEAT = 20
+
+def synthetic_hotel_page(num_links=3000):
+    """Build a large WordPress-style hotel homepage with mostly non-contact links"""
+    parts = ["<html><head><title>Hôtel Exemple</title></head><body>"]
+    parts.append("<nav>")
+    for i in range(num_links):
+        parts.append(f'<a href="/chambres/chambre-{i}/?utm_source=menu">Chambre {i} <span>vue mer</span></a>')
+    parts.append("</nav>")
+    parts.append('<a href="/contact/">Nous contacter</a> <a href="/mentions-legales/">Mentions légales</a>')
+    parts.append('<footer><p>Hôtel Exemple, 12 rue du Port, 13002 Marseille</p>')
+    parts.append('<p>Réservations : <a href="tel:+33491541952">04 91 54 19 52</a></p>')
+    parts.append('<p><a href="mailto:contact@hotel-exemple.fr">contact@hotel-exemple.fr</a></p>')
+    parts.append("<p>GPS : 43.296086, 5.378054</p></footer></body></html>")
+    return "\n".join(parts)
+
+# The three anchor loops as they were before scan_anchors (for comparison).
+# Text extraction is shared with the current code, so only the link passes differ.
+
+def legacy_emails(soup, text):
+    emails = set()
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+        if href.startswith(('mailto:', 'goto:', 'email:', 'e-mail:', 'mail:')):
+            for prefix in ['mailto:', 'goto:', 'email:', 'e-mail:', 'mail:']:
+                if href.startswith(prefix):
+                    email = href.replace(prefix, '').split('?')[0].strip()
+                    break
+            email = re.sub(r'\s+', '', email)
+            if '@' in email and '.' in email:
+                emails.add(email.lower())
+    return scraper.extract_emails_from_text(text, emails)
+
+def legacy_phones(soup, text):
+    phones = set()
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+        if href.startswith(('tel:', 'call:', 'callto:', 'phone:')):
+            for prefix in ['tel:', 'call:', 'callto:', 'phone:']:
+                if href.startswith(prefix):
+                    phone = href.replace(prefix, '').strip()
+                    break
+            normalized = scraper.normalize_phone_to_e164(phone)
+            if normalized:
+                phones.add(normalized)
+    return scraper.extract_phones_from_text(text, phones)
+
+def legacy_contact_links(soup, base_url):
+    contact_keywords = [
+        'contact', 'nous-contacter', 'contactez', 'contactez-nous',
+        'about', 'a-propos', 'qui-sommes-nous',
+        'mentions-legales', 'mentions', 'legal', 'impressum',
+        'privacy', 'politique', 'confidentialite'
+    ]
+    contact_urls = []
+    base_domain = urlparse(base_url).netloc
+    for link in soup.find_all('a', href=True):
+        href = link.get('href', '').lower()
+        text = link.get_text().lower()
+        for keyword in contact_keywords:
+            if keyword in href or keyword in text.replace(' ', '-'):
+                full_url = urljoin(base_url, link['href'])
+                if urlparse(full_url).netloc == base_domain:
+                    contact_urls.append(full_url)
+                    break
+    return list(set(contact_urls))[:scraper.MAX_CONTACT_PAGES]
+
+def three_pass(soup, text):
+    emails = legacy_emails(soup, text)
+    phones = legacy_phones(soup, text)
+    contact_urls = legacy_contact_links(soup, BASE_URL)
+    return emails, phones, contact_urls
+
+def single_pass(soup, text):
+    page = scraper.ParsedPage(scraper.soup_anchors(soup), text)
+    return scraper.extract_page_contacts(page, BASE_URL)
+
+def bench_page(name, html):
+    soup = BeautifulSoup(html, 'html.parser')
+    text = unescape(soup.get_text(separator='\n'))
+    anchors = len(soup.find_all('a', href=True))
+    
+    old = sorted(map(sorted, three_pass(soup, text)))
+    new = sorted(map(sorted, single_pass(soup, text)))
+    assert old == new, f"{name}: single-pass results differ from three-pass results"
+    
+    t_old = min(timeit.repeat(lambda: three_pass(soup, text), number=REPEAT, repeat=3)) / REPEAT
+    t_new = min(timeit.repeat(lambda: single_pass(soup, text), number=REPEAT, repeat=3)) / REPEAT
+    
+    print(f"{name[:40]:<40} {anchors:>7} {t_old*1000:>10.2f} {t_new*1000:>10.2f} {t_old/t_new:>7.2f}x")
+
+def main():
+    pages = [(path, Path(path).read_text(encoding='utf-8', errors='replace')) for path in sys.argv[1:]]
+    if not pages:
+        pages = [("synthetic hotel homepage", synthetic_hotel_page())]
+    
+    print(f"{'Page':<40} {'Anchors':>7} {'3-pass ms':>10} {'1-pass ms':>10} {'Speedup':>8}")
+    print("-"*79)
+    for name, html in pages:
+        bench_page(name, html)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+HTML parser backend benchmark
+Times every installed backend from html_backends on a corpus of saved pages and
+checks that each one yields the same contacts as the reference html.parser.
+
+Usage:
+    python benchmarks/bench_parsers.py [page.html | directory ...]
+
+Without arguments the pages in benchmarks/fixtures/ are used.
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import contact_scraper as scraper
+from html_backends import available_backends
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+BASE_URL = "https://www.hotel-du-vieux-port.fr/"
+REPEAT = 20
+
+def load_corpus(paths):
+    """Read every .html file from the given files/directories"""
+    files = []
+    for path in map(Path, paths or [FIXTURES_DIR]):
+        files.extend(sorted(path.glob("*.html")) if path.is_dir() else [path])
+    return [(f.name, f.read_text(encoding='utf-8', errors='replace')) for f in files]
+
+def extract(html, backend):
+    """Parse with one backend and run the extractors - returns comparable results"""
+    scraper.HTML_PARSER = backend
+    page = scraper.parse_page(html)
+    emails, phones, contact_urls = scraper.extract_page_contacts(page, BASE_URL)
+    return sorted(emails), sorted(phones), sorted(contact_urls), [href for href, _ in page.anchors]
+
+def main():
+    corpus = load_corpus(sys.argv[1:])
+    backends = available_backends()
+    
+    print(f"Corpus: {len(corpus)} page(s), {sum(len(html) for _, html in corpus) / 1024:.0f} KB")
+    print(f"Backends: {', '.join(backends)}\n")
+    print(f"{'Backend':<12} {'Total ms':>10} {'vs html.parser':>15}  Same contacts")
+    print("-"*60)
+    
+    reference = {name: extract(html, 'html.parser') for name, html in corpus}
+    timings = {}
+    for backend in reversed(backends):
+        timings[backend] = sum(
+            min(timeit.repeat(lambda: extract(html, backend), number=REPEAT, repeat=3)) / REPEAT
+            for _, html in corpus
+        )
+        mismatches = [name for name, html in corpus if extract(html, backend)[:3] != reference[name][:3]]
+        same = "yes" if not mismatches else "NO: " + ", ".join(mismatches)
+        speedup = timings['html.parser'] / timings[backend]
+        print(f"{backend:<12} {timings[backend]*1000:>10.2f} {speedup:>14.2f}x  {same}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Regex micro-benchmark
+Compares the legacy per-call pattern strings (three phone patterns per text
+line, GPS checks on every line) with the precompiled combined patterns from
+extraction_patterns, on the visible text of real pages.
+
+Usage:
+    python benchmarks/bench_patterns.py [page.html | directory ...]
+
+Without arguments the pages in benchmarks/fixtures/ are used.
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import contact_scraper as scraper
+from html_backends import parse_html
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+REPEAT = 200
+
+def legacy_phones(text):
+    """Text phone extraction as it was before extraction_patterns (for comparison)"""
+    phones = set()
+    patterns = [
+        r'\+33\s*[1-9](?:[\s.-]*\d{2}){4}',
+        r'0[1-9](?:[\s.-]*\d{2}){4}',
+        r'\b0[1-9]\d{8}\b',
+    ]
+    for chunk in text.split('\n'):
+        if len(re.findall(r'[-+]?\d{1,3}\.\d{4,}', chunk)) >= 2:
+            continue
+        if re.search(r'(latitude|longitude|lat|lon|coords?|gps)', chunk.lower()):
+            continue
+        if re.search(r'(°|latitude|longitude|coords)', chunk.lower()):
+            continue
+        for pattern in patterns:
+            for match in re.findall(pattern, chunk):
+                if '.' in match or ',' in match:
+                    if re.match(r'\d+\.\d{4,}', match.replace(',', '.')):
+                        continue
+                if len(re.sub(r'\D', '', match)) < 9:
+                    continue
+                if not match.strip().startswith(('+', '0')):
+                    continue
+                normalized = scraper.normalize_phone_to_e164(match)
+                if normalized:
+                    phones.add(normalized)
+    return sorted(p for p in phones
+                  if len(set(re.sub(r'\D', '', p))) > 1 and re.sub(r'\D', '', p) not in '0123456789' * 2)
+
+def legacy_emails(text):
+    """Text email extraction with an uncompiled pattern string (for comparison)"""
+    found = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    return sorted({re.sub(r'\s+', '', e).lower() for e in found})
+
+def legacy(text):
+    return legacy_emails(text), legacy_phones(text)
+
+def compiled(text):
+    return sorted(scraper.extract_emails_from_text(text)), sorted(scraper.extract_phones_from_text(text))
+
+def main():
+    files = []
+    for path in map(Path, sys.argv[1:] or [FIXTURES_DIR]):
+        files.extend(sorted(path.glob("*.html")) if path.is_dir() else [path])
+    
+    print(f"{'Page':<32} {'Lines':>6} {'Legacy ms':>10} {'Compiled ms':>12} {'Speedup':>8}")
+    print("-"*72)
+    for f in files:
+        text = scraper.unescape(parse_html(f.read_text(encoding='utf-8', errors='replace'), 'html.parser').text)
+        assert legacy(text) == compiled(text), f"{f.name}: compiled patterns give different results"
+        
+        t_legacy = min(timeit.repeat(lambda: legacy(text), number=REPEAT, repeat=3)) / REPEAT
+        t_compiled = min(timeit.repeat(lambda: compiled(text), number=REPEAT, repeat=3)) / REPEAT
+        print(f"{f.name[:32]:<32} {text.count(chr(10)) + 1:>6} {t_legacy*1000:>10.3f} {t_compiled*1000:>12.3f} {t_legacy/t_compiled:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Byte-offset index over a CSV file
+Reads any slice of rows with one seek, so chunks never need to be copied to disk
+"""
+
+import os
+import json
+
+INDEX_STRIDE = 100  # Rows between two recorded offsets
+
+def _open_quote(line, in_quotes):
+    """Whether a quoted field is still open at the end of line
+    
+    Follows the csv dialect: a quote only opens a quoted field when it starts
+    the field (Hotel 5" stars is plain text), and "" inside one is a literal quote.
+    """
+    i = 0
+    field_start = not in_quotes
+    while True:
+        if in_quotes:
+            i = line.find(b'"', i)
+            if i == -1:
+                return True
+            if line[i + 1:i + 2] == b'"':
+                i += 2
+                continue
+            in_quotes = False
+            field_start = False
+            i += 1
+        else:
+            if field_start and line[i:i + 1] == b'"':
+                in_quotes = True
+                i += 1
+                continue
+            i = line.find(b',', i)
+            if i == -1:
+                return False
+            field_start = True
+            i += 1
+
+def _read_record(f):
+    """Read one CSV record (quoted fields may span lines) - returns its bytes, b'' at end of file"""
+    record = f.readline()
+    in_quotes = b'"' in record and _open_quote(record, False)
+    # The line break is inside a quoted field: the record goes on
+    while in_quotes:
+        line = f.readline()
+        if not line:
+            break
+        record += line
+        in_quotes = _open_quote(line, True)
+    return record
+
+def build_index(input_file, stride=INDEX_STRIDE):
+    """Scan a CSV once and record the byte offset of every `stride`-th data row"""
+    stat = os.stat(input_file)
+    offsets = []
+    total_rows = 0
+    
+    with open(input_file, 'rb') as f:
+        position = len(_read_record(f))  # Header
+        header_end = position
+        while True:
+            record = _read_record(f)
+            if not record:
+                break
+            # Blank lines are skipped by the CSV reader, so they are not rows
+            if record.strip():
+                if total_rows % stride == 0:
+                    offsets.append(position)
+                total_rows += 1
+            position += len(record)
+    
+    return {
+        'input_file': str(input_file),
+        'input_size': stat.st_size,
+        'input_mtime': stat.st_mtime,
+        'header_end': header_end,
+        'stride': stride,
+        'total_rows': total_rows,
+        'offsets': offsets,
+    }
+
+def save_index(index, index_file):
+    """Write the index atomically"""
+    tmp_file = f"{index_file}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    os.replace(tmp_file, index_file)
+
+def load_index(index_file):
+    """Load an index, refusing one whose CSV has changed since it was built"""
+    with open(index_file, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    
+    stat = os.stat(index['input_file'])
+    if stat.st_size != index['input_size'] or stat.st_mtime != index['input_mtime']:
+        raise ValueError(f"{index['input_file']} changed since it was indexed - delete {index_file} to re-index")
+    return index
+
+def read_rows(index, start_row, num_rows):
+    """Header plus rows [start_row, start_row + num_rows) of the indexed CSV, as raw bytes"""
+    if start_row >= index['total_rows']:
+        return b''
+    
+    stride = index['stride']
+    with open(index['input_file'], 'rb') as f:
+        header = f.read(index['header_end'])
+        f.seek(index['offsets'][start_row // stride])
+        
+        # Walk from the recorded offset to the first wanted row
+        to_skip = start_row % stride
+        while to_skip:
+            record = _read_record(f)
+            if not record:
+                break
+            if record.strip():
+                to_skip -= 1
+        
+        records = []
+        while len(records) < num_rows:
+            record = _read_record(f)
+            if not record:
+                break
+            if record.strip():
+                records.append(record)
+    
+    # The original last row may have no line break
+    if records and not records[-1].endswith(b'\n'):
+        records[-1] += b'\n'
+    return header + b''.join(records)
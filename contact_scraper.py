@@ -4,18 +4,96 @@ Extracts contact information from websites with robust phone validation
 """
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-import re
+import aiohttp
+import asyncio
+import os
+import json
+import atexit
 import time
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
 from html import unescape
 import sys
+from politeness import HostScheduler, host_key
+from http_cache import ResponseCache
+from domain_cache import DomainCache
+from dns_cache import DnsCache, CachedResolver
+from result_io import write_results
+from html_backends import ParsedPage, StreamingPageParser, parse_html, scan_links, sniff_encoding, soup_anchors
+from extraction_patterns import (
+    EMAIL_PATTERN, WHITESPACE, PHONE_PATTERN, NON_DIGIT, GPS_NUMBER, GPS_KEYWORDS, GPS_MARKERS,
+    GPS_DECIMAL, TRUNK_ZERO, COUNTRY_CODE_EXTRA_ZERO, CONTACT_KEYWORD_PATTERN,
+    CONTACT_HINTS
+)
+import codecs
 
 # Configuration
 TIMEOUT = 15
-DELAY = 2
+DELAY = 2                 # Seconds between requests to the same host
 MAX_CONTACT_PAGES = 3
+CONTACT_PAGE_CONCURRENCY = 3  # Contact pages of one site fetched at the same time
+CONCURRENCY = 50          # Max websites scraped at the same time
+POOL_SIZE = 100           # Max open connections in the shared pool
+POOL_PER_HOST = 4         # Max open connections to a single host
+KEEPALIVE_TIMEOUT = 30    # Seconds an idle connection stays open for reuse
+HTML_PARSER = 'auto'      # 'auto' (fastest installed), 'selectolax', 'lxml', 'bs4-lxml' or 'html.parser'
+PREFILTER_PAGES = True    # Skip the full parse of pages whose raw bytes cannot hold an email or phone
+MAX_BODY_BYTES = 2 * 1024 * 1024  # Stop downloading a page after this many bytes
+READ_CHUNK_SIZE = 64 * 1024       # Bytes read per streaming step
+INCREMENTAL_EXTRACTION = False    # Extract while downloading and hang up once email + phone are found
+HTTP_HEAD_START = 3               # Seconds HTTPS runs alone before an HTTP attempt races it
+HTTP_CACHE_DIR = None             # Folder for the on-disk page cache (None = no cache)
+HTTP_CACHE_TTL = 7 * 24 * 3600    # Seconds a cached page is reused before it is fetched again
+HTTP_CACHE_MAX_BYTES = 2 * 1024**3  # Size the cache is pruned back to
+HTTP_CACHE_ERROR_STATUSES = (404, 410)  # Error answers worth caching (429/5xx are temporary)
+HTTP_CACHE_KEEP = False           # Never prune pages stored by this run (archive for re-extraction)
+OFFLINE = False                   # Serve pages from the cache only, never from the network
+DEDUPLICATE_SITES = True          # Fetch each domain once and copy its result to every row using it
+DOMAIN_CACHE_FILE = None          # SQLite file of per-domain results shared across runs (None = off)
+
+# HTTP errors meaning the site is gone ("Does Not Exist"); others such as 403, 429 or 5xx
+# are reported as "HTTP Error" and treated as temporary
+GONE_STATUSES = (404, 410)
+
+# Days a stored domain result is reused before the site is scraped again
+# (results not listed here are never stored)
+DOMAIN_CACHE_TTL_DAYS = {
+    'Success': 30,
+    'No Contacts Found': 14,
+    'Does Not Exist': 7,
+    'Timeout': 1,
+    'Connection Failed': 1,
+    'HTTP Error': 1,
+    'Error': 1,
+}
+
+# Circuit breaker (uses DOMAIN_CACHE_FILE): domains failing again and again are skipped
+BREAKER_RESULTS = ('Does Not Exist', 'Connection Failed')  # Results that count as a failure
+BREAKER_THRESHOLD = 2             # Consecutive failures before a domain is skipped
+BREAKER_COOLDOWN = 24 * 3600      # Seconds of the first skip period, doubled on each new failure
+BREAKER_MAX_COOLDOWN = 30 * 24 * 3600
+
+# DNS pre-resolution: unresolvable hosts become "Does Not Exist" without any HTTP connection
+DNS_PRERESOLVE = True
+DNS_NAMESERVERS = None            # e.g. ['127.0.0.1'] for a local/stub resolver (needs aiodns)
+DNS_TIMEOUT = 5                   # Seconds per lookup (a timeout leaves the host to the HTTP stage)
+DNS_DEFAULT_TTL = 300             # Seconds system-resolver answers are cached (aiodns uses record TTLs)
+DNS_NEGATIVE_TTL = 3600           # Seconds a "does not exist" answer is cached
+
+# Query parameters that only track the visitor and never change the page
+TRACKING_PARAMS = ('utm_', 'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', '_ga', 'yclid')
+
+# Content types worth parsing (a missing Content-Type header is given the benefit of the doubt)
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain', 'text/xml', 'application/xml')
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+# aiohttp is unreliable on the default Windows Proactor loop
+if os.name == 'nt':
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 # Comprehensive country code to ISO mapping with territories (200+ countries)
 COUNTRY_CODES = {
@@ -180,44 +258,77 @@ def normalize_url(url):
         url = 'https://' + url
     return url
 
-def extract_emails_from_html(soup, text):
-    """Extract emails from mailto links and text"""
-    emails = set()
-    
-    # Extract from links with various prefixes
-    for link in soup.find_all('a', href=True):
-        href = link['href']
-        if href.startswith(('mailto:', 'goto:', 'email:', 'e-mail:', 'mail:')):
-            # Remove prefix and clean
-            for prefix in ['mailto:', 'goto:', 'email:', 'e-mail:', 'mail:']:
-                if href.startswith(prefix):
-                    email = href.replace(prefix, '').split('?')[0].strip()
-                    break
-            
-            # Remove whitespace and validate
-            email = re.sub(r'\s+', '', email)
-            if '@' in email and '.' in email:
-                emails.add(email.lower())
+def clean_url(url):
+    """Normalized URL without fragment or tracking query parameters (host and path kept as-is)"""
+    parts = urlparse(normalize_url(url))
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith(TRACKING_PARAMS)]
+    return urlunparse((parts.scheme, parts.netloc, parts.path, parts.params, urlencode(query), ''))
+
+def canonical_url(url):
+    """Comparison key for a site URL: https, lowercase host without www., no trailing slash"""
+    parts = urlparse(clean_url(url))
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return urlunparse(('https', host, parts.path.rstrip('/'), parts.params, parts.query, ''))
+
+def site_key(url):
+    """Dedup and domain-cache key: the domain for a homepage, else the canonical URL
+    
+    Pages on shared hosts (facebook.com/<page>, sites.google.com/..., booking
+    engines) belong to different businesses, so only a bare domain stands for
+    the whole host.
+    """
+    parts = urlparse(canonical_url(url))
+    if parts.path or parts.params or parts.query:
+        return urlunparse(parts)
+    return host_key(urlunparse(parts))
+
+# Link prefixes routed to the email / phone handlers
+EMAIL_LINK_PREFIXES = ('mailto:', 'goto:', 'email:', 'e-mail:', 'mail:')
+PHONE_LINK_PREFIXES = ('tel:', 'call:', 'callto:', 'phone:')
+
+def email_from_link(href):
+    """Extract an email from a mailto-style href (None if invalid)"""
+    # Remove prefix and clean
+    for prefix in EMAIL_LINK_PREFIXES:
+        if href.startswith(prefix):
+            email = href.replace(prefix, '').split('?')[0].strip()
+            break
+    
+    # Remove whitespace and validate
+    email = WHITESPACE.sub('', email)
+    if '@' in email and '.' in email:
+        return email.lower()
+    return None
+
+def extract_emails_from_text(text, link_emails=()):
+    """Extract emails from page text, merged with emails already found in links"""
+    emails = set(link_emails)
     
     # Extract from text using regex
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    found = re.findall(email_pattern, text)
+    found = EMAIL_PATTERN.findall(text)
     # Normalize whitespace
-    emails.update([re.sub(r'\s+', '', e).lower() for e in found])
+    emails.update([WHITESPACE.sub('', e).lower() for e in found])
     
     return list(emails)
 
+def extract_emails_from_html(soup, text):
+    """Extract emails from mailto links and text"""
+    link_emails, _, _ = scan_anchors(soup_anchors(soup))
+    return extract_emails_from_text(text, link_emails)
+
 def is_gps_coordinate(text):
     """Check if text looks like GPS coordinates"""
     # Match patterns like: 43.296086, 5.378054 or (43.296, 5.378)
-    gps_pattern = r'[-+]?\d{1,3}\.\d{4,}'
-    matches = re.findall(gps_pattern, text)
+    matches = GPS_NUMBER.findall(text)
     
     if len(matches) >= 2:
         return True
     
     # Check for lat/lon keywords nearby
-    if re.search(r'(latitude|longitude|lat|lon|coords?|gps)', text.lower()):
+    if GPS_KEYWORDS.search(text):
         return True
     
     return False
@@ -237,7 +348,7 @@ def normalize_phone_to_e164(phone):
     original_phone = phone
     
     # Remove (0) patterns: (0), ( 0 ), [0], [ 0 ]
-    phone = re.sub(r'[\(\[]\s*0\s*[\)\]]', '', phone)
+    phone = TRUNK_ZERO.sub('', phone)
     
     # Check if phone starts with 00 (European international prefix)
     if phone.strip().startswith('00'):
@@ -252,10 +363,10 @@ def normalize_phone_to_e164(phone):
     
     # Remove all non-digit characters except leading +
     if phone.startswith('+'):
-        digits = '+' + re.sub(r'\D', '', phone[1:])
+        digits = '+' + NON_DIGIT.sub('', phone[1:])
         digits = digits.lstrip('+')  # Remove + for processing
     else:
-        digits = re.sub(r'\D', '', phone)
+        digits = NON_DIGIT.sub('', phone)
     
     # Too short or too long
     if len(digits) < 9 or len(digits) > 15:
@@ -282,7 +393,7 @@ def normalize_phone_to_e164(phone):
             digits = '33' + digits[3:]
         
         # Fix: Handle any country code followed by extra 0
-        country_code_match = re.match(r'^(\d{2,3})0(\d{9})$', digits)
+        country_code_match = COUNTRY_CODE_EXTRA_ZERO.match(digits)
         if country_code_match:
             country_code = country_code_match.group(1)
             rest = country_code_match.group(2)
@@ -298,75 +409,67 @@ def normalize_phone_to_e164(phone):
     
     return None
 
-def extract_phones_from_html(soup, text):
-    """Extract and validate phone numbers with GPS filtering"""
-    phones = set()
-    
-    # Priority: tel and call links
-    for link in soup.find_all('a', href=True):
-        href = link['href']
-        if href.startswith(('tel:', 'call:', 'callto:', 'phone:')):
-            # Remove prefix
-            for prefix in ['tel:', 'call:', 'callto:', 'phone:']:
-                if href.startswith(prefix):
-                    phone = href.replace(prefix, '').strip()
-                    break
-            
-            normalized = normalize_phone_to_e164(phone)
-            if normalized:
-                phones.add(normalized)
+def phone_from_link(href):
+    """Extract a normalized phone from a tel-style href (None if invalid)"""
+    # Remove prefix
+    for prefix in PHONE_LINK_PREFIXES:
+        if href.startswith(prefix):
+            phone = href.replace(prefix, '').strip()
+            break
+    
+    return normalize_phone_to_e164(phone)
+
+def extract_phones_from_text(text, link_phones=()):
+    """Extract and validate phone numbers with GPS filtering (tel link phones take priority)"""
+    phones = set(link_phones)
     
     # If we found tel links, prefer those
     if phones:
         return list(phones)
     
-    # Extract from text - multiple French formats
+    # Extract from text - multiple French formats (one combined pattern)
     # Split text into chunks to avoid GPS coordinates
     chunks = text.split('\n')
     
-    patterns = [
-        r'\+33\s*[1-9](?:[\s.-]*\d{2}){4}',  # +33 4 91 54 19 52
-        r'0[1-9](?:[\s.-]*\d{2}){4}',        # 04 91 54 19 52
-        r'\b0[1-9]\d{8}\b',                   # 0491541952
-    ]
-    
     for chunk in chunks:
+        matches = PHONE_PATTERN.findall(chunk)
+        if not matches:
+            continue
+        
         # Skip chunks that look like GPS coordinates
         if is_gps_coordinate(chunk):
             continue
         
         # Skip chunks with typical GPS markers
-        if re.search(r'(°|latitude|longitude|coords)', chunk.lower()):
+        if GPS_MARKERS.search(chunk):
             continue
         
-        for pattern in patterns:
-            matches = re.findall(pattern, chunk)
-            for match in matches:
-                # Additional validation
-                clean_match = re.sub(r'\D', '', match)
-                
-                # Reject if it looks like a decimal number
-                if '.' in match or ',' in match:
-                    # Check if it's like "5.378054" (GPS)
-                    if re.match(r'\d+\.\d{4,}', match.replace(',', '.')):
-                        continue
-                
-                # Reject short numbers (likely IDs)
-                if len(clean_match) < 9:
-                    continue
-                
-                # Must start with 0 or + for French
-                if not match.strip().startswith(('+', '0')):
+        for match in matches:
+            # Additional validation
+            clean_match = NON_DIGIT.sub('', match)
+            
+            # Reject if it looks like a decimal number
+            if '.' in match or ',' in match:
+                # Check if it's like "5.378054" (GPS)
+                if GPS_DECIMAL.match(match.replace(',', '.')):
                     continue
-                
-                normalized = normalize_phone_to_e164(match)
-                if normalized:
-                    phones.add(normalized)
+            
+            # Reject short numbers (likely IDs)
+            if len(clean_match) < 9:
+                continue
+            
+            # Must start with 0 or + for French
+            if not match.strip().startswith(('+', '0')):
+                continue
+            
+            normalized = normalize_phone_to_e164(match)
+            if normalized:
+                phones.add(normalized)
     
     # Filter out numbers that are too similar to each other (likely IDs)
     filtered_phones = []
     for phone in phones:
-        digits = re.sub(r'\D', '', phone)
+        digits = NON_DIGIT.sub('', phone)
         # Reject if all digits are the same (11111111)
         if len(set(digits)) == 1:
             continue
@@ -377,38 +480,337 @@ def extract_phones_from_html(soup, text):
     
     return filtered_phones
 
-def find_contact_page_links(soup, base_url):
-    """Find links to contact-type pages"""
-    contact_keywords = [
-        'contact', 'nous-contacter', 'contactez', 'contactez-nous',
-        'about', 'a-propos', 'qui-sommes-nous',
-        'mentions-legales', 'mentions', 'legal', 'impressum',
-        'privacy', 'politique', 'confidentialite'
-    ]
+def extract_phones_from_html(soup, text):
+    """Extract and validate phone numbers with GPS filtering"""
+    _, link_phones, _ = scan_anchors(soup_anchors(soup))
+    return extract_phones_from_text(text, link_phones)
+
+def is_contact_link(href, link_text):
+    """Check if a link URL or its text points to a contact-type page"""
+    if CONTACT_KEYWORD_PATTERN.search(href.lower()):
+        return True
+    # Link text is only read when the URL itself did not match
+    return CONTACT_KEYWORD_PATTERN.search(link_text().lower().replace(' ', '-')) is not None
+
+def scan_anchors(anchors, base_url=None):
+    """Visit every link once and route it to the email, phone or contact-page handler
     
+    anchors is a list of (href, get_text) pairs from html_backends.
+    Returns (link_emails, link_phones, contact_urls). Contact pages are only
+    collected when base_url is given.
+    """
+    link_emails = set()
+    link_phones = set()
     contact_urls = []
-    base_domain = urlparse(base_url).netloc
+    base_domain = urlparse(base_url).netloc if base_url else None
     
-    for link in soup.find_all('a', href=True):
-        href = link.get('href', '').lower()
-        text = link.get_text().lower()
+    for href, link_text in anchors:
+        if href.startswith(EMAIL_LINK_PREFIXES):
+            email = email_from_link(href)
+            if email:
+                link_emails.add(email)
         
-        # Check URL and link text
-        for keyword in contact_keywords:
-            if keyword in href or keyword in text.replace(' ', '-'):
-                full_url = urljoin(base_url, link['href'])
-                link_domain = urlparse(full_url).netloc
-                
-                # Must be same domain
-                if link_domain == base_domain:
-                    contact_urls.append(full_url)
-                    break
+        elif href.startswith(PHONE_LINK_PREFIXES):
+            phone = phone_from_link(href)
+            if phone:
+                link_phones.add(phone)
+        
+        elif base_domain is not None and is_contact_link(href, link_text):
+            full_url = urljoin(base_url, href)
+            
+            # Must be same domain
+            if urlparse(full_url).netloc == base_domain:
+                contact_urls.append(full_url)
     
     # Deduplicate and limit
-    return list(set(contact_urls))[:MAX_CONTACT_PAGES]
+    return link_emails, link_phones, list(set(contact_urls))[:MAX_CONTACT_PAGES]
 
-def scrape_website(url, progress_info=""):
-    """Scrape website for emails and phones with early stopping - returns (emails, phones, website_status, scraping_result)"""
+def find_contact_page_links(soup, base_url):
+    """Find links to contact-type pages"""
+    _, _, contact_urls = scan_anchors(soup_anchors(soup), base_url)
+    return contact_urls
+
+def parse_page(html):
+    """Parse HTML with the configured backend - returns ParsedPage(anchors, text)"""
+    page = parse_html(html, HTML_PARSER)
+    return ParsedPage(page.anchors, unescape(page.text))
+
+def decode_body(body, encoding):
+    """Decode raw page bytes, falling back to UTF-8 for unknown charsets"""
+    try:
+        return body.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+def is_ascii_compatible(encoding):
+    """Byte-level regexes only make sense for ASCII-compatible encodings"""
+    try:
+        return not codecs.lookup(encoding or 'utf-8').name.startswith(('utf-16', 'utf-32'))
+    except LookupError:
+        return True
+
+def parse_body(body, encoding, want_links=True):
+    """Decode and parse a fetched page, prefiltering on raw bytes
+    
+    Pages without any contact hint skip the full parse: homepages only get
+    a lightweight link scan (for contact-page discovery), other pages nothing.
+    """
+    if PREFILTER_PAGES and is_ascii_compatible(encoding) and not CONTACT_HINTS.search(body):
+        if not want_links:
+            return ParsedPage([], '')
+        return scan_links(decode_body(body, encoding))
+    return parse_page(decode_body(body, encoding))
+
+def extract_page_contacts(page, base_url=None):
+    """Single-pass page extraction - returns (emails, phones, contact_urls)"""
+    link_emails, link_phones, contact_urls = scan_anchors(page.anchors, base_url)
+    emails = extract_emails_from_text(page.text, link_emails)
+    phones = extract_phones_from_text(page.text, link_phones)
+    return emails, phones, contact_urls
+
+class NotHtmlError(Exception):
+    """Raised when a page URL serves something that is not HTML (PDF, image, archive...)"""
+
+class NotCachedError(Exception):
+    """Raised in OFFLINE mode when a page is not in the cache"""
+
+_cache = None
+
+def get_cache():
+    """Response cache for the current HTTP_CACHE_* settings, or None when caching is off"""
+    global _cache
+    if HTTP_CACHE_DIR is None:
+        return None
+    settings = (HTTP_CACHE_DIR, HTTP_CACHE_TTL, HTTP_CACHE_MAX_BYTES, OFFLINE, HTTP_CACHE_KEEP)
+    if _cache is None or (_cache.directory, _cache.ttl, _cache.max_bytes, _cache.offline, _cache.keep) != settings:
+        _cache = ResponseCache(*settings)
+    return _cache
+
+async def cache_response(cache, url, response, body, complete=True):
+    """Store an aiohttp response (body already read) in the page cache, off the event loop"""
+    content_type = response.content_type if 'Content-Type' in response.headers else None
+    await asyncio.get_running_loop().run_in_executor(
+        None, cache.put, url, str(response.url), response.status, content_type, response.charset,
+        dict(response.headers), body, complete
+    )
+
+def replay_response(cached, on_chunk=None):
+    """Serve a cached response the way fetch_page would - returns (body bytes, encoding)"""
+    if cached.status >= 400:
+        raise aiohttp.ClientResponseError(None, (), status=cached.status, message='cached')
+    if cached.content_type is not None and cached.content_type not in HTML_CONTENT_TYPES:
+        raise NotHtmlError(cached.content_type)
+    
+    body = cached.body
+    if on_chunk is not None:
+        for start in range(0, len(body), READ_CHUNK_SIZE):
+            if on_chunk(body[start:start + READ_CHUNK_SIZE], cached.charset):
+                body = body[:start + READ_CHUNK_SIZE]
+                break
+    return body, sniff_encoding(body, cached.charset)
+
+class IncrementalExtractor:
+    """Runs the link and text extractors on a page while it is still downloading
+    
+    Downloaded chunks go through a streaming tokenizer; only the anchors and
+    text nodes that arrived since the previous chunk are scanned. Seeded with
+    the contacts already found on the site, so feed() reports as soon as the
+    site has both an email and a phone.
+    """
+    
+    def __init__(self, found_emails=(), found_phones=()):
+        self.parser = StreamingPageParser()
+        self.decoder = None
+        self.emails = set(found_emails)
+        self.phones = set(found_phones)
+        self._anchors_done = 0
+        self._text_done = 0
+    
+    def feed(self, chunk, charset=None):
+        """Consume one downloaded chunk - returns True once email + phone are found"""
+        if self.decoder is None:
+            encoding = sniff_encoding(chunk, charset) or 'utf-8'
+            try:
+                self.decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            except LookupError:
+                self.decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self.parser.feed(self.decoder.decode(chunk))
+        
+        # The last text node may still grow with the next chunk
+        self._extract(len(self.parser.text_parts) - 1)
+        return bool(self.emails and self.phones)
+    
+    def _extract(self, text_end):
+        anchors = self.parser.anchors[self._anchors_done:]
+        self._anchors_done = len(self.parser.anchors)
+        link_emails, link_phones, _ = scan_anchors(anchors)
+        self.emails.update(link_emails)
+        self.phones.update(link_phones)
+        
+        if text_end > self._text_done:
+            text = unescape('\n'.join(self.parser.text_parts[self._text_done:text_end]))
+            self._text_done = text_end
+            self.emails.update(extract_emails_from_text(text))
+            self.phones.update(extract_phones_from_text(text))
+    
+    def page(self):
+        """Finish tokenizing - returns everything received as a ParsedPage"""
+        self.parser.feed(self.decoder.decode(b'', final=True) if self.decoder else '')
+        self.parser.close()
+        page = self.parser.page()
+        return ParsedPage(page.anchors, unescape(page.text))
+
+async def fetch_page(session, scheduler, url, on_chunk=None):
+    """GET a page politely, streaming at most MAX_BODY_BYTES - returns (body bytes, encoding)
+    
+    Raises on HTTP errors, and NotHtmlError before reading a non-HTML body.
+    Reading stops early once the end of <body> has arrived, or when
+    on_chunk(chunk, charset) returns True.
+    
+    With HTTP_CACHE_DIR set, fresh cached responses are served without
+    touching the network (or the politeness delay) and new ones are stored.
+    Of the error answers only HTTP_CACHE_ERROR_STATUSES are cached, so an
+    outage is retried next time instead of replayed as a dead site.
+    """
+    loop = asyncio.get_running_loop()
+    cache = get_cache()
+    if cache is not None:
+        # zlib and file I/O run in a worker thread so other downloads keep going
+        cached = await loop.run_in_executor(None, cache.get, url)
+        if cached is not None and (OFFLINE or cached.status < 400 or cached.status in HTTP_CACHE_ERROR_STATUSES):
+            return replay_response(cached, on_chunk)
+    if OFFLINE:
+        raise NotCachedError(url)
+    
+    await scheduler.wait(url)
+    async with session.get(url, headers=HEADERS, allow_redirects=True) as response:
+        if cache is not None and response.status in HTTP_CACHE_ERROR_STATUSES:
+            await cache_response(cache, url, response, b'')
+        response.raise_for_status()
+        
+        if 'Content-Type' in response.headers and response.content_type not in HTML_CONTENT_TYPES:
+            if cache is not None:
+                await cache_response(cache, url, response, b'')
+            raise NotHtmlError(response.content_type)
+        
+        body = bytearray()
+        complete = True
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            chunk = chunk[:MAX_BODY_BYTES - len(body)]
+            start = max(0, len(body) - 6)  # '</body' may straddle two chunks
+            body += chunk
+            if on_chunk is not None and on_chunk(chunk, response.charset):
+                complete = False
+                break
+            if len(body) >= MAX_BODY_BYTES:
+                break
+            if body[start:].lower().find(b'</body') != -1:
+                break
+        
+        body = bytes(body)
+        if cache is not None:
+            await cache_response(cache, url, response, body, complete)
+        return body, sniff_encoding(body, response.charset)
+
+async def fetch_and_parse(session, scheduler, url, want_links=True, found_emails=(), found_phones=()):
+    """Fetch and parse a page - returns ParsedPage
+    
+    With INCREMENTAL_EXTRACTION the page is tokenized while it downloads and
+    the download stops as soon as the site has an email and a phone.
+    """
+    if INCREMENTAL_EXTRACTION:
+        extractor = IncrementalExtractor(found_emails, found_phones)
+        await fetch_page(session, scheduler, url, extractor.feed)
+        return extractor.page()
+    
+    body, encoding = await fetch_page(session, scheduler, url)
+    return parse_body(body, encoding, want_links)
+
+# Scheme that last answered for each host, so later fetches skip the race
+_preferred_scheme = {}
+
+async def fetch_homepage(session, scheduler, url, log):
+    """Fetch the homepage, racing HTTPS against a delayed HTTP attempt - returns (page, url)
+    
+    HTTP starts after HTTP_HEAD_START seconds, or immediately if HTTPS fails
+    first. The first success wins and its scheme is remembered for the host;
+    later fetches try that scheme alone, then the other one if it fails.
+    """
+    key = host_key(url)
+    address = url.split('://', 1)[1]
+    
+    preferred = _preferred_scheme.get(key)
+    if preferred:
+        preferred_url = f"{preferred}://{address}"
+        try:
+            return await fetch_and_parse(session, scheduler, preferred_url), preferred_url
+        except NotHtmlError:
+            raise
+        except Exception as e:
+            # The host changed since it was remembered: fall back to the other scheme
+            _preferred_scheme.pop(key, None)
+            preferred_error = e
+        
+        other = 'http' if preferred == 'https' else 'https'
+        other_url = f"{other}://{address}"
+        log.append(f"    ↳ {preferred.upper()} failed, trying {other.upper()}...")
+        try:
+            page = await fetch_and_parse(session, scheduler, other_url)
+        except NotHtmlError:
+            raise
+        except Exception as e:
+            # Both failed: report the HTTP error, like the race below
+            raise (e if other == 'http' else preferred_error)
+        _preferred_scheme[key] = other
+        return page, other_url
+    
+    if not url.startswith('https://'):
+        return await fetch_and_parse(session, scheduler, url), url
+    
+    http_url = f"http://{address}"
+    https_failed = asyncio.Event()
+    
+    async def try_https():
+        try:
+            return await fetch_and_parse(session, scheduler, url), url
+        except NotHtmlError:
+            raise
+        except Exception:
+            https_failed.set()
+            raise
+    
+    async def try_http():
+        try:
+            await asyncio.wait_for(https_failed.wait(), HTTP_HEAD_START)
+        except asyncio.TimeoutError:
+            pass
+        log.append(f"    ↳ Trying HTTP fallback...")
+        return await fetch_and_parse(session, scheduler, http_url), http_url
+    
+    https_task = asyncio.ensure_future(try_https())
+    http_task = asyncio.ensure_future(try_http())
+    pending = {https_task, http_task}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    page, winner = task.result()
+                    _preferred_scheme[key] = winner.split('://', 1)[0]
+                    return page, winner
+                if isinstance(error, NotHtmlError):
+                    raise error
+        
+        # Both failed: report the HTTP error, like the old sequential fallback
+        raise http_task.exception()
+    finally:
+        for task in (https_task, http_task):
+            task.cancel()
+        await asyncio.gather(https_task, http_task, return_exceptions=True)
+
+async def _scrape_site(session, scheduler, url, progress_info, log):
+    """Scrape one website, appending progress lines to log - returns (emails, phones, website_status, scraping_result)"""
     all_emails = set()
     all_phones = set()
     pages_checked = 0
@@ -416,98 +818,225 @@ def scrape_website(url, progress_info=""):
     try:
         # Normalize URL
         url = normalize_url(url)
-        print(f"  {progress_info}Checking {url}...")
+        log.append(f"  {progress_info}Checking {url}...")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7',
-        }
+        # HTTPS first, with HTTP racing it after a head start
+        page, url = await fetch_homepage(session, scheduler, url, log)
         
-        # Try HTTPS first
-        try:
-            response = requests.get(url, timeout=TIMEOUT, headers=headers, allow_redirects=True)
-            response.raise_for_status()
-        except (requests.RequestException, Exception):
-            # Fallback to HTTP
-            if url.startswith('https://'):
-                url = url.replace('https://', 'http://')
-                print(f"    ↳ Trying HTTP fallback...")
-                response = requests.get(url, timeout=TIMEOUT, headers=headers, allow_redirects=True)
-                response.raise_for_status()
-            else:
-                raise
-        
-        # Parse homepage
-        soup = BeautifulSoup(response.text, 'html.parser')
-        text = unescape(soup.get_text(separator='\n'))
-        
-        emails = extract_emails_from_html(soup, text)
-        phones = extract_phones_from_html(soup, text)
+        # Extract from homepage
+        emails, phones, contact_pages = extract_page_contacts(page, url)
         
         all_emails.update(emails)
         all_phones.update(phones)
         pages_checked += 1
         
-        print(f"    ↳ Homepage: {len(emails)} email(s), {len(phones)} phone(s)")
+        log.append(f"    ↳ Homepage: {len(emails)} email(s), {len(phones)} phone(s)")
         
         # Early stop if we have both email and phone
         if all_emails and all_phones:
-            print(f"    ✓ Found email + phone, stopping early")
+            log.append(f"    ✓ Found email + phone, stopping early")
             return list(all_emails), list(all_phones), "OK", "Success"
         
-        # Check contact pages
-        contact_pages = find_contact_page_links(soup, url)
+        # Check contact pages concurrently (per-host politeness still spaces their starts)
+        semaphore = asyncio.Semaphore(CONTACT_PAGE_CONCURRENCY)
         
-        for contact_url in contact_pages:
-            # Early stop check
-            if all_emails and all_phones:
-                break
-            
-            try:
-                time.sleep(DELAY)
-                print(f"    ↳ Checking: {contact_url.split('/')[-1][:40]}...")
-                
-                contact_resp = requests.get(contact_url, timeout=TIMEOUT, headers=headers)
-                contact_resp.raise_for_status()
-                contact_soup = BeautifulSoup(contact_resp.text, 'html.parser')
-                contact_text = unescape(contact_soup.get_text(separator='\n'))
+        async def check_contact_page(contact_url):
+            async with semaphore:
+                log.append(f"    ↳ Checking: {contact_url.split('/')[-1][:40]}...")
+                return await fetch_and_parse(
+                    session, scheduler, contact_url, want_links=False,
+                    found_emails=all_emails, found_phones=all_phones
+                )
+        
+        tasks = [asyncio.ensure_future(check_contact_page(contact_url)) for contact_url in contact_pages]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                try:
+                    contact_page = await next_page
+                except Exception as e:
+                    continue
                 
-                contact_emails = extract_emails_from_html(contact_soup, contact_text)
-                contact_phones = extract_phones_from_html(contact_soup, contact_text)
+                contact_emails, contact_phones, _ = extract_page_contacts(contact_page)
                 
                 all_emails.update(contact_emails)
                 all_phones.update(contact_phones)
                 pages_checked += 1
                 
                 if contact_emails or contact_phones:
-                    print(f"      → {len(contact_emails)} email(s), {len(contact_phones)} phone(s)")
+                    log.append(f"      → {len(contact_emails)} email(s), {len(contact_phones)} phone(s)")
                 
-            except Exception as e:
-                continue
+                # Early stop: the remaining pages are cancelled below
+                if all_emails and all_phones:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
         
         # Determine status
         if all_emails or all_phones:
-            print(f"    ✓ Total: {len(all_emails)} email(s), {len(all_phones)} phone(s) from {pages_checked} page(s)")
+            log.append(f"    ✓ Total: {len(all_emails)} email(s), {len(all_phones)} phone(s) from {pages_checked} page(s)")
             return list(all_emails), list(all_phones), "OK", "Success"
         else:
-            print(f"    ✗ No contacts found on {pages_checked} page(s)")
+            log.append(f"    ✗ No contacts found on {pages_checked} page(s)")
             return [], [], "OK", "No Contacts Found"
         
-    except requests.Timeout:
-        print(f"    ✗ Timeout")
+    except NotHtmlError as e:
+        log.append(f"    ✗ Not an HTML page ({e})")
+        return [], [], "OK", "No Contacts Found"
+    except NotCachedError:
+        log.append(f"    ✗ Not in page cache (offline)")
+        return list(all_emails), list(all_phones), "Unavailable", "Not Cached"
+    except asyncio.TimeoutError:
+        log.append(f"    ✗ Timeout")
         return list(all_emails), list(all_phones), "Unavailable", "Timeout"
-    except requests.ConnectionError:
-        print(f"    ✗ Connection failed")
+    except aiohttp.ClientResponseError as e:
+        log.append(f"    ✗ HTTP {e.status}")
+        result = "Does Not Exist" if e.status in GONE_STATUSES else "HTTP Error"
+        return list(all_emails), list(all_phones), "Unavailable", result
+    except aiohttp.ClientConnectionError:
+        log.append(f"    ✗ Connection failed")
         return list(all_emails), list(all_phones), "Unavailable", "Connection Failed"
-    except requests.HTTPError as e:
-        status_code = e.response.status_code
-        print(f"    ✗ HTTP {status_code}")
-        return list(all_emails), list(all_phones), "Unavailable", "Does Not Exist"
     except Exception as e:
-        print(f"    ✗ Error: {type(e).__name__}")
+        log.append(f"    ✗ Error: {type(e).__name__}")
         return list(all_emails), list(all_phones), "Unavailable", "Error"
 
+def check_circuit(url, log):
+    """Skip result for a site whose circuit is open, else None"""
+    domain_cache = get_domain_cache()
+    domain = site_key(url)
+    if domain_cache is None or OFFLINE or not domain:
+        return None
+    
+    circuit = domain_cache.open_circuit(domain)
+    if circuit is None:
+        return None
+    
+    failures, last_result, open_until = circuit
+    days = (open_until - time.time()) / 86400
+    log.append(f"    ⏭ Skipped: {failures} failures in a row ({last_result}), retry in {days:.1f} day(s)")
+    return [], [], "Unavailable", "Skipped"
+
+def record_circuit(url, result, log):
+    """Feed a scrape result to the circuit breaker"""
+    domain_cache = get_domain_cache()
+    domain = site_key(url)
+    if domain_cache is None or OFFLINE or not domain:
+        return
+    
+    scraping_result = result[3]
+    if scraping_result in BREAKER_RESULTS:
+        open_until = domain_cache.record_failure(
+            domain, scraping_result, BREAKER_THRESHOLD, BREAKER_COOLDOWN, BREAKER_MAX_COOLDOWN
+        )
+        if open_until is not None:
+            log.append(f"    ⏸ Circuit open: {domain} skipped for {(open_until - time.time()) / 86400:.1f} day(s)")
+    elif result[2] == "OK":
+        domain_cache.record_success(domain)
+
+async def scrape_website_async(session, scheduler, url, progress_info=""):
+    """Scrape one website on a shared session, printing its log as one block"""
+    log = []
+    try:
+        skipped = check_circuit(url, log)
+        if skipped is not None:
+            log.insert(0, f"  {progress_info}Checking {normalize_url(url)}...")
+            return skipped
+        
+        host = urlparse(normalize_url(url)).hostname
+        if DNS_PRERESOLVE and not OFFLINE and _dns.does_not_exist(host):
+            log.append(f"  {progress_info}Checking {normalize_url(url)}...")
+            log.append(f"    ✗ DNS: {host} does not exist")
+            result = [], [], "Unavailable", "Does Not Exist"
+        else:
+            result = await _scrape_site(session, scheduler, url, progress_info, log)
+        record_circuit(url, result, log)
+        return result
+    finally:
+        # Buffered so concurrent sites don't interleave their output
+        print('\n'.join(log) + '\n')
+
+# Shared HTTP session: one connection pool reused across rows and chunks
+_loop = None
+_session = None
+_session_loop = None
+_scheduler = None
+_dns = None
+
+def _get_loop():
+    """Return the persistent event loop that owns the shared session"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+def get_session():
+    """Return the shared (session, scheduler) pair, creating it on the running loop if needed"""
+    global _session, _session_loop, _scheduler, _dns
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _dns = DnsCache(DNS_NAMESERVERS, DNS_TIMEOUT, DNS_DEFAULT_TTL, DNS_NEGATIVE_TTL)
+        connector = aiohttp.TCPConnector(
+            limit=POOL_SIZE,
+            limit_per_host=POOL_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            resolver=CachedResolver(_dns)
+        )
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=TIMEOUT, sock_read=TIMEOUT)
+        _session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        _session_loop = loop
+        _scheduler = HostScheduler(DELAY)
+    return _session, _scheduler
+
+def close_session():
+    """Close the shared HTTP session and its event loop"""
+    global _loop, _session, _session_loop, _scheduler, _dns
+    if _loop is not None and not _loop.is_closed():
+        if _session is not None and not _session.closed:
+            _loop.run_until_complete(_session.close())
+        _loop.close()
+    _loop = _session = _session_loop = _scheduler = _dns = None
+
+atexit.register(close_session)
+
+async def scrape_websites_async(urls, progress_infos=None, concurrency=None, on_result=None):
+    """Scrape many websites concurrently - returns one result tuple per URL, in input order
+    
+    on_result(i, result) is called as soon as urls[i] finishes, in completion order.
+    """
+    concurrency = concurrency or CONCURRENCY
+    if progress_infos is None:
+        progress_infos = [""] * len(urls)
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    session, scheduler = get_session()
+    
+    # Resolve every hostname at once: dead names are answered below without an HTTP attempt
+    if DNS_PRERESOLVE and not OFFLINE:
+        started = time.time()
+        hosts = {urlparse(normalize_url(url)).hostname for url in urls}
+        hosts.discard(None)
+        missing = await _dns.resolve_all(hosts)
+        print(f"🔎 Resolved {len(hosts)} hostname(s) in {time.time() - started:.1f}s"
+              f" ({len(missing)} do not exist)\n")
+    
+    async def bounded(i, url, progress_info):
+        async with semaphore:
+            result = await scrape_website_async(session, scheduler, url, progress_info)
+        if on_result:
+            on_result(i, result)
+        return result
+    
+    return await asyncio.gather(*(bounded(i, url, info) for i, (url, info) in enumerate(zip(urls, progress_infos))))
+
+def scrape_websites(urls, progress_infos=None, concurrency=None, on_result=None):
+    """Blocking wrapper around scrape_websites_async (keeps the shared pool alive between calls)"""
+    return _get_loop().run_until_complete(scrape_websites_async(urls, progress_infos, concurrency, on_result))
+
+def scrape_website(url, progress_info=""):
+    """Scrape website for emails and phones with early stopping - returns (emails, phones, website_status, scraping_result)"""
+    return scrape_websites([url], [progress_info], concurrency=1)[0]
+
 def deduplicate_phones(phone_list):
     """Remove duplicate phone numbers that are the same number in different formats
     
@@ -531,7 +1060,7 @@ def deduplicate_phones(phone_list):
     
     for phone in normalized:
         # Get last 9 digits for comparison
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = NON_DIGIT.sub('', phone)
         
         if len(digits_only) >= 9:
             core = digits_only[-9:]  # Last 9 digits
@@ -546,7 +1075,74 @@ def deduplicate_phones(phone_list):
     
     return result
 
-def process_spreadsheet(input_file, url_column, output_file=None, chunk_info=None):
+def finalize_phones(phones):
+    """Deduplicated E.164 phones in output order"""
+    # Deduplicate phones (removes duplicates by comparing last 9 digits)
+    phones = deduplicate_phones(phones)
+    
+    # Final safety check: remove any remaining duplicates by last 9 digits
+    seen_cores = set()
+    final_phones = []
+    for phone in phones:
+        if phone:
+            # Get last 9 digits
+            digits_only = NON_DIGIT.sub('', phone)
+            core = digits_only[-9:] if len(digits_only) >= 9 else digits_only
+            
+            if core not in seen_cores:
+                seen_cores.add(core)
+                final_phones.append(phone)
+    
+    return final_phones
+
+def detect_country(url, phones):
+    """Country of a site: first from its primary phone (if international), then from its domain"""
+    country = 'UNK'
+    if phones:
+        country = detect_country_from_phone(phones[0])
+    
+    # Local number or no phone at all: try the domain
+    if country == 'UNK':
+        domain_country = detect_country_from_domain(str(url))
+        if domain_country:
+            country = domain_country
+    return country
+
+_domain_cache = None
+
+def get_domain_cache():
+    """Domain result store for the current DOMAIN_CACHE_FILE, or None when it is off"""
+    global _domain_cache
+    if DOMAIN_CACHE_FILE is None:
+        return None
+    if _domain_cache is None or _domain_cache.path != DOMAIN_CACHE_FILE:
+        _domain_cache = DomainCache(DOMAIN_CACHE_FILE, DOMAIN_CACHE_TTL_DAYS)
+    _domain_cache.ttl_days = DOMAIN_CACHE_TTL_DAYS
+    return _domain_cache
+
+def load_journal(journal_file):
+    """Load rows already scraped by an interrupted run - returns {row: (url, result)}"""
+    done = {}
+    if not os.path.exists(journal_file):
+        return done
+    
+    with open(journal_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # Partial last line from a crash
+            done[entry['row']] = (entry['url'], tuple(entry['result']))
+    
+    return done
+
+def append_journal(journal, row, url, result):
+    """Durably append one scraped row to an open journal file"""
+    journal.write(json.dumps({'row': row, 'url': url, 'result': list(result)}, ensure_ascii=False) + '\n')
+    journal.flush()
+    os.fsync(journal.fileno())
+
+def process_spreadsheet(input_file, url_column, output_file=None, chunk_info=None, journal_file=None, input_df=None):
     """Process the spreadsheet
     
     Args:
@@ -554,6 +1150,9 @@ def process_spreadsheet(input_file, url_column, output_file=None, chunk_info=Non
         url_column: Name of column containing URLs
         output_file: Optional output filename
         chunk_info: Optional tuple (current_chunk, total_chunks) for batch processing display
+        journal_file: Optional row journal path (default: output_file + '.journal'); each
+            scraped row is appended as it finishes, and a re-run skips rows already in it
+        input_df: Optional DataFrame of the rows to process; input_file is then only a label
     """
     
     print(f"\n{'='*70}")
@@ -563,7 +1162,9 @@ def process_spreadsheet(input_file, url_column, output_file=None, chunk_info=Non
     # Read file
     print(f"📂 Reading: {input_file}")
     try:
-        if input_file.lower().endswith('.csv'):
+        if input_df is not None:
+            df = input_df
+        elif input_file.lower().endswith('.csv'):
             df = pd.read_csv(input_file)
         else:
             df = pd.read_excel(input_file)
@@ -579,6 +1180,14 @@ def process_spreadsheet(input_file, url_column, output_file=None, chunk_info=Non
         print(f"   Available columns: {', '.join(df.columns)}")
         return
     
+    if output_file is None:
+        base = input_file.rsplit('.', 1)[0]
+        ext = input_file.rsplit('.', 1)[1] if '.' in input_file else 'xlsx'
+        output_file = f"{base}_contacts.{ext}"
+    
+    if journal_file is None:
+        journal_file = f"{output_file}.journal"
+    
     # Add result columns
     df['Email_Primary'] = ''
     df['Email_Additional'] = ''
@@ -591,6 +1200,11 @@ def process_spreadsheet(input_file, url_column, output_file=None, chunk_info=Non
     # Process each URL
     print(f"🌐 Scraping {len(df)} websites...\n")
     
+    # Resume from the journal of an interrupted run
+    journaled = load_journal(journal_file)
+    results_by_row = {}
+    
+    rows_to_scrape = []
     for idx, row in df.iterrows():
         url = row[url_column]
         
@@ -607,83 +1221,115 @@ def process_spreadsheet(input_file, url_column, output_file=None, chunk_info=Non
             df.at[idx, 'Scraping_Result'] = 'No URL'
             continue
         
-        emails, phones, website_status, scraping_result = scrape_website(str(url), progress)
+        if int(idx) in journaled and journaled[int(idx)][0] == str(url):
+            results_by_row[idx] = (str(url), journaled[int(idx)][1])
+            continue
         
-        # Deduplicate phones (removes duplicates by comparing last 9 digits)
-        phones = deduplicate_phones(phones)
+        rows_to_scrape.append((idx, str(url), progress))
+    
+    if results_by_row:
+        print(f"♻ Resuming: {len(results_by_row)} row(s) already scraped (from {journal_file})\n")
+    
+    # Group rows by site: each site is fetched once and its result copied to all its rows
+    sites = {}
+    for position, (idx, url, progress) in enumerate(rows_to_scrape):
+        key = site_key(url) if DEDUPLICATE_SITES else None
+        sites.setdefault(key or position, []).append(position)
+    site_rows = list(sites.values())
+    
+    # Shortest URL of the group stands for the site (all share the same canonical form)
+    site_urls = []
+    for positions in site_rows:
+        urls = [rows_to_scrape[p][1] for p in positions]
+        site_urls.append(clean_url(min(urls, key=lambda u: len(canonical_url(u)))))
+    
+    if len(site_rows) < len(rows_to_scrape):
+        print(f"🔗 {len(rows_to_scrape)} rows point to {len(site_rows)} unique sites "
+              f"({len(rows_to_scrape) - len(site_rows)} duplicate fetches saved)\n")
+    
+    # Fresh results from earlier runs are reused (an offline re-extraction always re-scores)
+    domain_cache = get_domain_cache()
+    site_results = [None] * len(site_rows)
+    if domain_cache is not None and not OFFLINE:
+        for i, site_url in enumerate(site_urls):
+            stored = domain_cache.get(site_key(site_url))
+            if stored is not None:
+                site_results[i] = (stored.emails, stored.phones, stored.website_status, stored.scraping_result)
+    sites_to_fetch = [i for i, result in enumerate(site_results) if result is None]
+    
+    if len(sites_to_fetch) < len(site_rows):
+        print(f"🗄 {len(site_rows) - len(sites_to_fetch)} site(s) reused from {DOMAIN_CACHE_FILE}\n")
+    
+    # Scrape all sites concurrently (bounded by CONCURRENCY), journaling each row as it finishes
+    with open(journal_file, 'a', encoding='utf-8') as journal:
+        def record(i, result):
+            for position in site_rows[i]:
+                idx, url, _ = rows_to_scrape[position]
+                append_journal(journal, int(idx), url, result)
         
-        # Final safety check: remove any remaining duplicates by last 9 digits
-        seen_cores = set()
-        final_phones = []
-        for phone in phones:
-            if phone:
-                # Get last 9 digits
-                digits_only = re.sub(r'\D', '', phone)
-                core = digits_only[-9:] if len(digits_only) >= 9 else digits_only
-                
-                if core not in seen_cores:
-                    seen_cores.add(core)
-                    final_phones.append(phone)
+        def record_fetched(j, result):
+            i = sites_to_fetch[j]
+            site_results[i] = result
+            record(i, result)
+            
+            # An offline re-extraction replays old pages: storing them would restart their TTL
+            domain = site_key(site_urls[i])
+            if domain_cache is not None and domain and not OFFLINE:
+                emails, phones, website_status, scraping_result = result
+                country = detect_country(site_urls[i], finalize_phones(phones))
+                domain_cache.put(domain, emails, phones, website_status, scraping_result, country)
+        
+        for i, result in enumerate(site_results):
+            if result is not None:
+                record(i, result)
         
-        phones = final_phones
+        scrape_websites(
+            [site_urls[i] for i in sites_to_fetch],
+            [rows_to_scrape[site_rows[i][0]][2] for i in sites_to_fetch],
+            on_result=record_fetched
+        )
+    
+    for positions, result in zip(site_rows, site_results):
+        for position in positions:
+            idx, url, _ = rows_to_scrape[position]
+            results_by_row[idx] = (url, result)
+    
+    for idx, (url, result) in results_by_row.items():
+        emails, phones, website_status, scraping_result = result
+        phones = finalize_phones(phones)
         
         # Assign emails
         df.at[idx, 'Email_Primary'] = emails[0] if emails else ''
         df.at[idx, 'Email_Additional'] = '; '.join(sorted(emails[1:])) if len(emails) > 1 else ''
         
         # Determine country: First from phone (if international), then from domain
-        country = 'UNK'
+        df.at[idx, 'Country'] = detect_country(url, phones)
+        
         if phones:
             # Primary phone
-            primary_phone = phones[0]
-            df.at[idx, 'Phone_Primary'] = "'" + primary_phone
-            
-            # Try to get country from phone first
-            country = detect_country_from_phone(primary_phone)
-            
-            # If phone didn't give us country (local number), try domain
-            if country == 'UNK':
-                domain_country = detect_country_from_domain(str(url))
-                if domain_country:
-                    country = domain_country
-            
-            df.at[idx, 'Country'] = country
+            df.at[idx, 'Phone_Primary'] = "'" + phones[0]
             
             # Additional phones (also with ' prefix to protect + sign in Excel)
             if len(phones) > 1:
                 protected_additional = ["'" + p for p in sorted(phones[1:])]
                 df.at[idx, 'Phone_Additional'] = '; '.join(protected_additional)
-        else:
-            # No phones found - try to get country from domain anyway
-            domain_country = detect_country_from_domain(str(url))
-            if domain_country:
-                country = domain_country
-            df.at[idx, 'Country'] = country
         
         df.at[idx, 'Website_Status'] = website_status
         df.at[idx, 'Scraping_Result'] = scraping_result
-        
-        if idx < len(df) - 1:
-            time.sleep(DELAY)
-        print()
     
     # Save
-    if output_file is None:
-        base = input_file.rsplit('.', 1)[0]
-        ext = input_file.rsplit('.', 1)[1] if '.' in input_file else 'xlsx'
-        output_file = f"{base}_contacts.{ext}"
-    
     print(f"💾 Saving to: {output_file}")
     try:
-        if output_file.lower().endswith('.csv'):
-            df.to_csv(output_file, index=False, encoding='utf-8-sig')
-        else:
-            df.to_excel(output_file, index=False, engine='openpyxl')
+        write_results(df, output_file)
         print(f"✅ Saved!\n")
     except Exception as e:
         print(f"❌ Error saving: {e}")
+        print(f"   Scraped rows are kept in {journal_file} for the next run")
         return
     
+    # Output is safely written: the journal is no longer needed
+    os.remove(journal_file)
+    
     # Summary
     print(f"{'='*70}")
     print(f"SUMMARY")
@@ -0,0 +1,141 @@
+"""
+DNS pre-resolution
+Resolve every hostname of a batch up front and keep the answers for their TTL
+"""
+
+import time
+import socket
+import asyncio
+import ipaddress
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import DefaultResolver
+
+# Optional async resolver (real TTLs, custom nameservers)
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+# getaddrinfo errors that mean "this name does not exist" (not "try again later")
+NOT_FOUND_ERRORS = {code for code in (getattr(socket, 'EAI_NONAME', None), getattr(socket, 'EAI_NODATA', None))
+                    if code is not None}
+
+def is_ip_address(host):
+    """True for IPv4/IPv6 literals, which need no lookup"""
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+class DnsCache:
+    """hostname -> addresses, cached for the record TTL (negative answers included)
+    
+    Uses aiodns when installed, which also allows pointing at specific
+    nameservers (e.g. a local stub resolver); otherwise the system resolver
+    via getaddrinfo, whose answers are kept for default_ttl seconds.
+    Lookups that time out or fail for other reasons are not cached.
+    """
+    
+    def __init__(self, nameservers=None, timeout=5, default_ttl=300, negative_ttl=3600, concurrency=100):
+        if nameservers and aiodns is None:
+            raise ValueError("Custom DNS nameservers need aiodns (pip install aiodns)")
+        self.timeout = timeout
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.concurrency = concurrency
+        self._resolver = aiodns.DNSResolver(nameservers=nameservers or None, timeout=timeout) if aiodns else None
+        self._answers = {}  # host -> ([(family, address)], expires_at)
+    
+    def cached(self, host):
+        """Cached addresses of host ([] = does not exist), or None if unknown or expired"""
+        answer = self._answers.get(host)
+        if answer is None or answer[1] <= time.time():
+            return None
+        return answer[0]
+    
+    def does_not_exist(self, host):
+        return self.cached(host) == []
+    
+    async def _lookup_aiodns(self, host):
+        # c-ares getaddrinfo also answers from the hosts file, like the system resolver
+        try:
+            result = await asyncio.wait_for(
+                self._resolver.getaddrinfo(host, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM), self.timeout
+            )
+        except aiodns.error.DNSError as e:
+            if e.args and e.args[0] in (aiodns.error.ARES_ENOTFOUND, aiodns.error.ARES_ENODATA):
+                # Not in DNS: intranet / split-horizon names may still resolve locally
+                return await self._lookup_system(host)
+            return None
+        except asyncio.TimeoutError:
+            return None
+        
+        addresses = []
+        for node in result.nodes:
+            address = node.addr[0]
+            addresses.append((node.family, address.decode() if isinstance(address, bytes) else address))
+        if not addresses:
+            return await self._lookup_system(host)
+        ttl = min(getattr(node, 'ttl', self.default_ttl) for node in result.nodes) or self.default_ttl
+        return addresses, ttl
+    
+    async def _lookup_system(self, host):
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await asyncio.wait_for(loop.getaddrinfo(host, None, type=socket.SOCK_STREAM), self.timeout)
+        except socket.gaierror as e:
+            if e.errno in NOT_FOUND_ERRORS:
+                return [], self.negative_ttl
+            return None
+        except asyncio.TimeoutError:
+            return None
+        return [(family, sockaddr[0]) for family, _, _, _, sockaddr in infos], self.default_ttl
+    
+    async def resolve(self, host):
+        """Resolve and cache one hostname - returns addresses, [] if it does not exist, None if unknown"""
+        if not host or is_ip_address(host):
+            return None
+        addresses = self.cached(host)
+        if addresses is not None:
+            return addresses
+        
+        answer = await (self._lookup_aiodns(host) if self._resolver else self._lookup_system(host))
+        if answer is None:
+            return None
+        addresses, ttl = answer
+        self._answers[host] = (addresses, time.time() + ttl)
+        return addresses
+    
+    async def resolve_all(self, hosts):
+        """Resolve many hostnames concurrently - returns the set of hosts that do not exist"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def bounded(host):
+            async with semaphore:
+                return host, await self.resolve(host)
+        
+        answers = await asyncio.gather(*(bounded(host) for host in set(hosts)))
+        return {host for host, addresses in answers if addresses == []}
+
+class CachedResolver(AbstractResolver):
+    """aiohttp resolver answering from a DnsCache, falling back to aiohttp's default resolver"""
+    
+    def __init__(self, dns):
+        self.dns = dns
+        self._fallback = DefaultResolver()
+    
+    async def resolve(self, host, port=0, family=socket.AF_INET):
+        addresses = self.dns.cached(host) or []
+        hosts = [
+            {'hostname': host, 'host': address, 'port': port, 'family': address_family,
+             'proto': 0, 'flags': socket.AI_NUMERICHOST}
+            for address_family, address in addresses
+            if family in (socket.AF_UNSPEC, address_family)
+        ]
+        if hosts:
+            return hosts
+        return await self._fallback.resolve(host, port, family)
+    
+    async def close(self):
+        await self._fallback.close()
@@ -0,0 +1,106 @@
+"""
+Cross-run domain result cache
+Last scrape result of every domain in SQLite, reused while it is still fresh,
+plus a circuit breaker that skips domains which keep failing
+"""
+
+import json
+import time
+import sqlite3
+from collections import namedtuple
+
+DomainResult = namedtuple(
+    'DomainResult',
+    ['emails', 'phones', 'website_status', 'scraping_result', 'country', 'scraped_at']
+)
+
+class DomainCache:
+    """Site key (bare domain, or page URL on shared hosts) -> last result, shared by every run and input file
+    
+    ttl_days maps a Scraping_Result to how many days it stays fresh;
+    results missing from it are never stored. The database runs in WAL
+    mode so batch worker processes can read and write it concurrently.
+    """
+    
+    def __init__(self, path, ttl_days):
+        self.path = path
+        self.ttl_days = ttl_days
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS domain_results ('
+            ' domain TEXT PRIMARY KEY, emails TEXT, phones TEXT, website_status TEXT,'
+            ' scraping_result TEXT, country TEXT, scraped_at REAL)'
+        )
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS domain_failures ('
+            ' domain TEXT PRIMARY KEY, failures INTEGER, last_result TEXT,'
+            ' last_failure REAL, open_until REAL)'
+        )
+        self.db.commit()
+    
+    def is_fresh(self, scraping_result, scraped_at):
+        """Freshness policy: each kind of result has its own shelf life"""
+        ttl = self.ttl_days.get(scraping_result)
+        return ttl is not None and time.time() - scraped_at < ttl * 86400
+    
+    def get(self, domain):
+        """Fresh stored result for domain, or None"""
+        row = self.db.execute(
+            'SELECT emails, phones, website_status, scraping_result, country, scraped_at'
+            ' FROM domain_results WHERE domain = ?', (domain,)
+        ).fetchone()
+        if row is None or not self.is_fresh(row[3], row[5]):
+            return None
+        return DomainResult(json.loads(row[0]), json.loads(row[1]), *row[2:])
+    
+    def put(self, domain, emails, phones, website_status, scraping_result, country):
+        """Store the latest result of a domain (ignored for results without a TTL)"""
+        if scraping_result not in self.ttl_days:
+            return
+        self.db.execute(
+            'INSERT OR REPLACE INTO domain_results VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (domain, json.dumps(list(emails)), json.dumps(list(phones)),
+             website_status, scraping_result, country, time.time())
+        )
+        self.db.commit()
+    
+    def open_circuit(self, domain):
+        """(failures, last_result, open_until) while domain is in its cool-down, else None"""
+        row = self.db.execute(
+            'SELECT failures, last_result, open_until FROM domain_failures WHERE domain = ?', (domain,)
+        ).fetchone()
+        if row is None or row[2] is None or row[2] <= time.time():
+            return None
+        return row
+    
+    def record_failure(self, domain, scraping_result, threshold, cooldown, max_cooldown):
+        """Count a consecutive failure - returns the cool-down end once the circuit opens, else None
+        
+        The circuit opens after `threshold` failures in a row and its cool-down
+        doubles with every further failure, up to max_cooldown seconds.
+        """
+        row = self.db.execute(
+            'SELECT failures FROM domain_failures WHERE domain = ?', (domain,)
+        ).fetchone()
+        failures = (row[0] if row else 0) + 1
+        
+        now = time.time()
+        open_until = None
+        if failures >= threshold:
+            open_until = now + min(cooldown * 2 ** (failures - threshold), max_cooldown)
+        
+        self.db.execute(
+            'INSERT OR REPLACE INTO domain_failures VALUES (?, ?, ?, ?, ?)',
+            (domain, failures, scraping_result, now, open_until)
+        )
+        self.db.commit()
+        return open_until
+    
+    def record_success(self, domain):
+        """Close the circuit: the domain answered"""
+        self.db.execute('DELETE FROM domain_failures WHERE domain = ?', (domain,))
+        self.db.commit()
+    
+    def close(self):
+        self.db.close()
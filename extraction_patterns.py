@@ -0,0 +1,55 @@
+"""
+Extraction patterns
+Every regex used by the email/phone extractors, compiled once at import
+"""
+
+import re
+
+# Emails in page text
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+WHITESPACE = re.compile(r'\s+')
+
+# French phone formats in one alternation, so each text line is scanned once:
+#   +33 4 91 54 19 52
+#   04 91 54 19 52 / 04.91.54.19.52 / 0491541952 (zero separators)
+PHONE_PATTERN = re.compile(
+    r'\+33\s*[1-9](?:[\s.-]*\d{2}){4}'
+    r'|0[1-9](?:[\s.-]*\d{2}){4}'
+)
+NON_DIGIT = re.compile(r'\D')
+
+# GPS filtering
+GPS_NUMBER = re.compile(r'[-+]?\d{1,3}\.\d{4,}')                              # 43.296086
+GPS_KEYWORDS = re.compile(r'latitude|longitude|lat|lon|coords?|gps', re.IGNORECASE)
+GPS_MARKERS = re.compile(r'°|latitude|longitude|coords', re.IGNORECASE)
+GPS_DECIMAL = re.compile(r'\d+\.\d{4,}')                                      # 5.378054
+
+# Phone normalization
+TRUNK_ZERO = re.compile(r'[\(\[]\s*0\s*[\)\]]')                               # (0), [ 0 ]
+COUNTRY_CODE_EXTRA_ZERO = re.compile(r'^(\d{2,3})0(\d{9})$')                  # 330491541952
+
+# Contact-page discovery
+CONTACT_KEYWORDS = [
+    'contact', 'nous-contacter', 'contactez', 'contactez-nous',
+    'about', 'a-propos', 'qui-sommes-nous',
+    'mentions-legales', 'mentions', 'legal', 'impressum',
+    'privacy', 'politique', 'confidentialite'
+]
+CONTACT_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, CONTACT_KEYWORDS)))
+
+# Anything that may sit between phone digits in raw HTML: every character \s matches
+# in decoded text (ASCII, Latin-1 and UTF-8 bytes), dots, dashes, entities and tags
+_HINT_SEPARATOR = (
+    rb'(?:[\s.\-\x1c-\x1f\x85\xa0]|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]'
+    rb'|\xe2\x81\x9f|\xe3\x80\x80|&#?[a-z0-9]{1,20};|<[^>]{0,200}>)'
+)
+
+# Cheap raw-bytes test: can this page yield an email or phone at all?
+# Deliberately loose (entities, tags between digit pairs) - a false hit only costs a parse
+CONTACT_HINTS = re.compile(
+    rb'(?:mailto|goto|e-?mail|mail|tel|callto|call|phone):'
+    rb'|[A-Za-z0-9._%+-](?:@|&#0*64;|&#x0*40;|&commat;)[A-Za-z0-9-]'
+    rb'|(?:\+|&#0*43;|&#x0*2b;|&plus;)' + _HINT_SEPARATOR + rb'*33'
+    rb'|0[1-9](?:' + _HINT_SEPARATOR + rb'*\d{2}){4}',
+    re.IGNORECASE
+)
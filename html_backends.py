@@ -0,0 +1,201 @@
+"""
+HTML parser backends
+Turn raw HTML into the anchors + visible text view used by the extractors
+"""
+
+import re
+import codecs
+from collections import namedtuple
+from html import unescape
+from html.parser import HTMLParser
+from bs4 import BeautifulSoup
+
+# Optional fast parsers (selectolax >= 1.0 only ships the Lexbor engine)
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+# anchors: list of (href, get_text) - link text is read lazily, only when needed
+# text: visible text, one string per line (script/style content excluded)
+ParsedPage = namedtuple('ParsedPage', ['anchors', 'text'])
+
+# Tags whose content is never visible text
+NON_TEXT_TAGS = ['script', 'style', 'template']
+
+XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_.:\-]+)', re.IGNORECASE)
+
+# Lightweight <a href> scanner for pages that are not worth a full parse
+LINK_PATTERN = re.compile(
+    r'<a\s[^>]*?\bhref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))[^>]*>(.*?)</a\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+def available_backends():
+    """List installed backends, fastest first"""
+    backends = []
+    if SelectolaxParser is not None:
+        backends.append('selectolax')
+    if lxml is not None:
+        backends.append('lxml')
+        backends.append('bs4-lxml')
+    backends.append('html.parser')
+    return backends
+
+def resolve_backend(name):
+    """Map 'auto' to the fastest installed backend and validate explicit names"""
+    backends = available_backends()
+    if name == 'auto':
+        return backends[0]
+    if name not in backends:
+        raise ValueError(f"HTML parser backend '{name}' is not available (installed: {', '.join(backends)})")
+    return name
+
+def sniff_encoding(body, declared=None):
+    """Pick a page encoding: HTTP charset, then BOM, then <meta charset> in the first 4 KB"""
+    if declared:
+        return declared
+    if body.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if body.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    match = META_CHARSET.search(body, 0, 4096)
+    if match:
+        return match.group(1).decode('ascii')
+    return None
+
+def soup_anchors(soup):
+    """Anchors of an existing BeautifulSoup tree"""
+    return [(link['href'], link.get_text) for link in soup.find_all('a', href=True)]
+
+def _parse_bs4(html, features):
+    """Parse with BeautifulSoup (html.parser or lxml tree builder)"""
+    soup = BeautifulSoup(html, features)
+    return ParsedPage(soup_anchors(soup), soup.get_text(separator='\n'))
+
+def _parse_selectolax(html):
+    """Parse with selectolax (fastest)"""
+    tree = SelectolaxParser(html)
+
+    # Link text is cheap here, and nodes are invalidated by strip_tags below
+    anchors = []
+    for node in tree.css('a[href]'):
+        link_text = node.text()
+        anchors.append((node.attributes.get('href') or '', lambda link_text=link_text: link_text))
+
+    tree.strip_tags(NON_TEXT_TAGS)
+    text = tree.root.text(separator='\n') if tree.root is not None else ''
+    return ParsedPage(anchors, text)
+
+def _parse_lxml(html):
+    """Parse with lxml.html directly, without building a soup"""
+    # lxml refuses str input that still carries an encoding declaration
+    html = XML_DECLARATION.sub('', html, count=1)
+    if not html.strip():
+        return ParsedPage([], '')
+
+    # Doctype- or comment-only documents have no element to build a tree from
+    try:
+        doc = lxml.html.document_fromstring(html)
+    except etree.ParserError:
+        return ParsedPage([], '')
+
+    anchors = []
+    for node in doc.iter('a'):
+        href = node.get('href')
+        if href is not None:
+            link_text = node.text_content()
+            anchors.append((href, lambda link_text=link_text: link_text))
+
+    etree.strip_elements(doc, *NON_TEXT_TAGS, with_tail=False)
+    etree.strip_tags(doc, etree.Comment)
+    return ParsedPage(anchors, '\n'.join(doc.itertext()))
+
+def scan_links(html):
+    """Regex-only anchor scan (no DOM, no visible text) - returns ParsedPage(anchors, '')"""
+    anchors = []
+    for match in LINK_PATTERN.finditer(html):
+        href = unescape(match.group(1) or match.group(2) or match.group(3) or '')
+        link_text = unescape(TAG_PATTERN.sub('', match.group(4)))
+        anchors.append((href, lambda link_text=link_text: link_text))
+    return ParsedPage(anchors, '')
+
+class StreamingPageParser(HTMLParser):
+    """Incremental tokenizer: feed() HTML as it downloads and read anchors/text found so far"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.anchors = []       # (href, get_text), appended when </a> is seen
+        self.text_parts = []    # Visible text nodes, in document order
+        self._skip_depth = 0    # > 0 inside script/style/template
+        self._open_links = []   # (href, text parts) of <a> not closed yet
+        self._in_text = False   # Last event was text: feed() boundaries can split one text node
+    
+    def handle_starttag(self, tag, attrs):
+        self._in_text = False
+        if tag in NON_TEXT_TAGS:
+            self._skip_depth += 1
+        elif tag == 'a':
+            href = None
+            for name, value in attrs:
+                if name == 'href':
+                    href = value or ''
+            self._open_links.append((href, []))
+    
+    def handle_endtag(self, tag):
+        self._in_text = False
+        if tag in NON_TEXT_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == 'a' and self._open_links:
+            self._close_link()
+    
+    def handle_comment(self, data):
+        self._in_text = False
+    
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if self._in_text:
+            self.text_parts[-1] += data
+        else:
+            self.text_parts.append(data)
+        self._in_text = True
+        for _, parts in self._open_links:
+            parts.append(data)
+    
+    def _close_link(self):
+        href, parts = self._open_links.pop()
+        if href is not None:
+            link_text = ''.join(parts)
+            self.anchors.append((href, lambda link_text=link_text: link_text))
+    
+    def close(self):
+        super().close()
+        while self._open_links:
+            self._close_link()
+    
+    def page(self):
+        """Everything parsed so far as a ParsedPage"""
+        return ParsedPage(self.anchors, '\n'.join(self.text_parts))
+
+def parse_html(html, backend='auto'):
+    """Parse HTML with the given backend - returns ParsedPage(anchors, text)"""
+    backend = resolve_backend(backend)
+    if backend == 'selectolax':
+        return _parse_selectolax(html)
+    if backend == 'lxml':
+        return _parse_lxml(html)
+    if backend == 'bs4-lxml':
+        return _parse_bs4(html, 'lxml')
+    return _parse_bs4(html, 'html.parser')
@@ -0,0 +1,157 @@
+"""
+On-disk HTTP response cache
+Raw page bodies stored content-addressed and indexed by URL, so re-runs skip the network
+"""
+
+import os
+import json
+import time
+import zlib
+import hashlib
+import threading
+from collections import namedtuple
+
+# status/headers as received; body is the (possibly capped) raw bytes that were read
+CachedResponse = namedtuple(
+    'CachedResponse',
+    ['url', 'status', 'content_type', 'charset', 'headers', 'body', 'fetched_at', 'complete']
+)
+
+def url_key(url):
+    """File name of a URL's index entry"""
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+def _write_atomic(path, data):
+    """Write bytes via a temp file so readers in other processes or threads never see half a file"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+class ResponseCache:
+    """Responses on disk: index/<sha256(url)>.json -> bodies/<sha256(body)>.z
+    
+    Entries are keyed by the final URL after redirects, with an alias for
+    the requested URL. Identical bodies are stored once. Entries older than
+    `ttl` seconds are ignored unless the cache is offline, and prune()
+    drops expired entries then the oldest ones until bodies fit `max_bytes`.
+    Entries stored with `keep` set are an archive for offline re-extraction:
+    prune() never removes them and they do not count toward `max_bytes`.
+    """
+    
+    def __init__(self, directory, ttl, max_bytes, offline=False, keep=False):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.keep = keep
+        self.index_dir = os.path.join(directory, 'index')
+        self.bodies_dir = os.path.join(directory, 'bodies')
+        os.makedirs(self.index_dir, exist_ok=True)
+        os.makedirs(self.bodies_dir, exist_ok=True)
+    
+    def _entry_path(self, url):
+        return os.path.join(self.index_dir, url_key(url) + '.json')
+    
+    def _body_path(self, digest):
+        return os.path.join(self.bodies_dir, digest + '.z')
+    
+    def get(self, url):
+        """Cached response for url, or None if missing, expired or incomplete (online only)"""
+        try:
+            with open(self._entry_path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            with open(self._body_path(entry['body']), 'rb') as f:
+                body = zlib.decompress(f.read())
+        except (OSError, ValueError, KeyError, zlib.error):
+            return None
+        
+        if not self.offline:
+            # Pages cut short by an early stop are only good enough for offline replays
+            if time.time() - entry['fetched_at'] > self.ttl or not entry['complete']:
+                return None
+        
+        return CachedResponse(
+            entry['url'], entry['status'], entry['content_type'], entry['charset'],
+            entry['headers'], body, entry['fetched_at'], entry['complete']
+        )
+    
+    def put(self, requested_url, response_url, status, content_type, charset, headers, body, complete=True):
+        """Store a response under its final URL and the URL that was requested"""
+        digest = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(digest)
+        if not os.path.exists(body_path):
+            _write_atomic(body_path, zlib.compress(body, 1))
+        
+        entry = json.dumps({
+            'url': response_url,
+            'status': status,
+            'content_type': content_type,
+            'charset': charset,
+            'headers': headers,
+            'body': digest,
+            'size': len(body),
+            'fetched_at': time.time(),
+            'complete': complete,
+            'keep': self.keep,
+        }).encode('utf-8')
+        
+        for url in {response_url, requested_url}:
+            _write_atomic(self._entry_path(url), entry)
+    
+    def prune(self):
+        """Drop expired entries, then the oldest until bodies fit max_bytes - returns bytes freed
+        
+        Kept entries are left alone, and so are the bodies they point to.
+        """
+        now = time.time()
+        entries = []
+        kept = set()
+        for name in os.listdir(self.index_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.index_dir, name)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if entry.get('keep'):
+                kept.add(entry['body'])
+            elif now - entry.get('fetched_at', 0) > self.ttl:
+                os.remove(path)
+            else:
+                entries.append((entry['fetched_at'], path, entry['body']))
+        
+        # Bodies still referenced by a live entry, with their on-disk size
+        entries.sort()
+        refs = {}
+        for _, _, digest in entries:
+            refs[digest] = refs.get(digest, 0) + 1
+        
+        freed = 0
+        sizes = {}
+        for name in os.listdir(self.bodies_dir):
+            if not name.endswith('.z'):
+                continue  # Another process may be mid-write
+            digest = name[:-2]
+            path = os.path.join(self.bodies_dir, name)
+            if digest in kept:
+                continue
+            if digest in refs:
+                sizes[digest] = os.path.getsize(path)
+            else:
+                freed += os.path.getsize(path)
+                os.remove(path)
+        
+        total = sum(sizes.values())
+        for _, path, digest in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            refs[digest] -= 1
+            if refs[digest] == 0 and digest in sizes:
+                os.remove(self._body_path(digest))
+                total -= sizes[digest]
+                freed += sizes[digest]
+        return freed
@@ -0,0 +1,35 @@
+"""
+Per-host politeness scheduler
+Spaces out requests to the same website while unrelated websites run back-to-back
+"""
+
+import asyncio
+from urllib.parse import urlparse
+
+def host_key(url):
+    """Politeness key for a URL: lowercase hostname without port or leading www."""
+    host = (urlparse(url).hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return host
+
+class HostScheduler:
+    """Enforces a minimum delay between request starts to the same host
+
+    Each call to wait() reserves the next free slot for its host, so
+    concurrent callers hitting one site are spaced `delay` seconds apart
+    while callers on other sites are never blocked.
+    """
+
+    def __init__(self, delay):
+        self.delay = delay
+        self._next_slot = {}  # host -> loop time of the next free slot
+
+    async def wait(self, url):
+        """Sleep until a request to url's host is allowed"""
+        key = host_key(url)
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot.get(key, now))
+        self._next_slot[key] = slot + self.delay
+        if slot > now:
+            await asyncio.sleep(slot - now)
@@ -0,0 +1,168 @@
+"""
+Result table I/O
+Write and read scraper result tables as CSV, Excel or Parquet
+"""
+
+import pandas as pd
+
+# Optional columnar output
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+except ImportError:
+    pyarrow = None
+
+# Optional fast Excel writer (openpyxl write-only mode otherwise)
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# Rows per worksheet, header included
+EXCEL_MAX_ROWS = 1048576
+
+# '; '-joined text in CSV/Excel, real list<string> columns in Parquet
+LIST_COLUMNS = ['Email_Additional', 'Phone_Additional']
+
+# CSV/Excel phones start with ' so spreadsheet apps keep the + sign; Parquet stores them bare
+PHONE_COLUMNS = ['Phone_Primary', 'Phone_Additional']
+
+def require_parquet():
+    """Fail early with an install hint when pyarrow is missing"""
+    if pyarrow is None:
+        raise ValueError("Parquet output needs pyarrow (pip install pyarrow)")
+
+def is_parquet(path):
+    return str(path).lower().endswith('.parquet')
+
+def _as_list(value):
+    """A '; '-joined cell (or an existing list) as a list of strings"""
+    if isinstance(value, (list, tuple)) or hasattr(value, 'tolist'):
+        items = list(value)
+    elif value is None or value is pd.NA or (isinstance(value, float) and pd.isna(value)):
+        items = []
+    else:
+        items = str(value).split('; ')
+    return [str(item).lstrip("'") for item in items if str(item).strip()]
+
+def to_parquet_table(df):
+    """Typed Arrow table: text as string columns (empty = null), additional contacts as lists"""
+    require_parquet()
+    df = df.copy()
+    for col in df.columns:
+        if col in LIST_COLUMNS:
+            df[col] = df[col].map(_as_list)
+        elif pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col]):
+            # object on pandas < 3, the str dtype from pandas 3 on
+            values = df[col].astype('string')
+            if col in PHONE_COLUMNS:
+                values = values.str.lstrip("'")
+            df[col] = values.replace('', pd.NA)
+    
+    table = pyarrow.Table.from_pandas(df, preserve_index=False)
+    
+    # All-empty list columns would otherwise be typed list<null>
+    for col in LIST_COLUMNS:
+        if col in table.column_names:
+            i = table.column_names.index(col)
+            table = table.set_column(i, col, table.column(col).cast(pyarrow.list_(pyarrow.string())))
+    return table
+
+def _excel_rows(df):
+    """Data rows as plain Python values (None for missing, lists '; '-joined)"""
+    values = df.astype(object).where(df.notna(), None)
+    for col in LIST_COLUMNS:
+        if col in values.columns:
+            values[col] = values[col].map(lambda v: '; '.join(map(str, v)) if isinstance(v, (list, tuple)) else v)
+    return values.itertuples(index=False, name=None)
+
+def write_excel(df, path):
+    """Stream a table to .xlsx row by row, starting a new sheet at Excel's row limit
+    
+    Uses xlsxwriter in constant-memory mode when installed, else openpyxl's
+    write-only mode; both keep memory flat instead of building the workbook.
+    """
+    header = [str(col) for col in df.columns]
+    rows_per_sheet = EXCEL_MAX_ROWS - 1
+    
+    if xlsxwriter is not None:
+        # Cells are data: no formula, URL or number guessing (URLs would also hit a per-sheet cap)
+        workbook = xlsxwriter.Workbook(path, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+            'strings_to_numbers': False,
+        })
+        try:
+            sheet = None
+            for i, row in enumerate(_excel_rows(df)):
+                if i % rows_per_sheet == 0:
+                    sheet = workbook.add_worksheet(f"Sheet{i // rows_per_sheet + 1}")
+                    sheet.write_row(0, 0, header)
+                sheet.write_row(i % rows_per_sheet + 1, 0, row)
+            if sheet is None:
+                workbook.add_worksheet("Sheet1").write_row(0, 0, header)
+        finally:
+            workbook.close()
+        return
+    
+    from openpyxl import Workbook
+    workbook = Workbook(write_only=True)
+    sheet = None
+    for i, row in enumerate(_excel_rows(df)):
+        if i % rows_per_sheet == 0:
+            sheet = workbook.create_sheet(f"Sheet{i // rows_per_sheet + 1}")
+            sheet.append(header)
+        sheet.append(row)
+    if sheet is None:
+        workbook.create_sheet("Sheet1").append(header)
+    workbook.save(path)
+
+def write_results(df, path):
+    """Save a result table; the format follows the file extension"""
+    path = str(path)
+    if path.lower().endswith('.csv'):
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+    elif is_parquet(path):
+        pq.write_table(to_parquet_table(df), path)
+    else:
+        write_excel(df, path)
+
+def read_results(path, columns=None):
+    """Load a result table, optionally only some columns (Parquet skips the others on disk)"""
+    if is_parquet(path):
+        require_parquet()
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, usecols=columns)
+
+def has_rows(path):
+    """True if a result file holds at least one data row, without reading it all"""
+    if is_parquet(path):
+        require_parquet()
+        return pq.ParquetFile(path).metadata.num_rows > 0
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        f.readline()  # Header
+        return f.readline().strip() != ''
+
+class ParquetAppender:
+    """Appends DataFrames to one Parquet file as row groups, holding one at a time in memory"""
+    
+    def __init__(self, path):
+        require_parquet()
+        self.path = str(path)
+        self.writer = None
+        self.rows = 0
+    
+    def append(self, df):
+        table = to_parquet_table(df)
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            # Same columns and types as the first chunk, whatever their order here
+            table = table.select(self.writer.schema.names).cast(self.writer.schema)
+        self.writer.write_table(table)
+        self.rows += table.num_rows
+    
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()